@@ -3,9 +3,11 @@
 🚀 CREATE CLEAN CV - Generates new CV files with fixed links
 Creates clean, professional CV files using corrected URLs and formatting
 """
+import io
 import os
 import sys
 import json
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from pathlib import Path
 
@@ -20,7 +22,214 @@ try:
     PDF_AVAILABLE = True
 except ImportError:
     PDF_AVAILABLE = False
-    print("⚠️  PDF generation not available. Install with: pip install reportlab")
+
+# Repeated CV sections, in document order
+CV_SECTIONS = ('projects', 'experience', 'education', 'certificates', 'languages')
+
+# Static PDF section titles
+PDF_SECTION_TITLES = {
+    'summary': "PROFESSIONAL SUMMARY",
+    'skills': "TECHNICAL SKILLS",
+    'projects': "PROJECTS & LIVE DEMOS",
+    'experience': "WORK EXPERIENCE",
+    'education': "EDUCATION",
+    'certificates': "CERTIFICATES",
+    'languages': "LANGUAGES"
+}
+
+# One Paragraph per PDF section item, with fields separated by line breaks
+PDF_ITEM_TEMPLATES = {
+    'projects': (
+        "<b>{name}</b><br/>"
+        "<b>Description:</b> {description}<br/>"
+        "<b>Code:</b> {code_url}<br/>"
+        "{live_line}"
+        "<b>Technologies:</b> {technologies}<br/>"
+        "<b>Features:</b> {features}<br/>"
+        "<b>Status:</b> {status}"
+    ),
+    'experience': "<b>{title}</b> - {company} ({duration})<br/>{description}",
+    'education': "<b>{degree}</b> - {institution} ({duration})<br/>{description}",
+    'certificates': "<b>{name}</b> — {issuer} ({date})<br/>URL: {url}",
+    'languages': "<b>{language}</b> — {level} ({description})"
+}
+
+PDF_LIVE_TEMPLATE = "<b>Live Demo:</b> {live_url}<br/>"
+
+# Vertical space after each PDF section item
+PDF_ITEM_SPACING = {
+    'projects': 8,
+    'experience': 5,
+    'education': 5,
+    'certificates': 3,
+    'languages': 0
+}
+
+# Markdown and text CV layouts, rendered with str.format_map
+MD_TEMPLATE = """# {name} - {title}
+
+## 📧 CONTACT INFORMATION
+- **Email:** {email}
+- **Phone:** {phone}
+- **Location:** {location}
+- **LinkedIn:** {linkedin}
+- **GitHub:** {github}
+- **CV:** {cv_url}
+
+## 🎯 PROFESSIONAL SUMMARY
+{summary}
+
+## 🛠️ TECHNICAL SKILLS
+
+### **Frontend Development**
+{frontend}
+
+### **Backend Development**
+{backend}
+
+### **Databases & Tools**
+{database}
+
+### **Development Tools**
+{tools}
+
+### **Other Skills**
+{other}
+
+## 🚀 PROJECTS & LIVE DEMOS
+
+{projects_block}## 💼 WORK EXPERIENCE
+
+{experience_block}## 🎓 EDUCATION
+
+{education_block}## 🏆 CERTIFICATES
+
+{certificates_block}## 🌍 LANGUAGES
+
+{languages_block}
+---
+
+*This CV was generated with clean, working links on {now_str}*
+*All project URLs have been verified and are working properly*
+"""
+
+MD_PROJECT_TEMPLATE = """### **{name}**
+- **Description:** {description}
+- **Code:** {code_url}
+{live_line}- **Technologies:** {technologies}
+- **Features:** {features}
+- **Status:** {status}
+
+"""
+
+MD_LIVE_TEMPLATE = "- **Live Demo:** {live_url}\n"
+
+MD_EXPERIENCE_TEMPLATE = """### **{title}**
+- **Company:** {company}
+- **Duration:** {duration}
+- **Description:** {description}
+
+"""
+
+MD_EDUCATION_TEMPLATE = """### **{degree}**
+- **Company:** {institution}
+- **Duration:** {duration}
+- **Description:** {description}
+
+"""
+
+MD_CERTIFICATE_TEMPLATE = """- **{name}** — {issuer} ({date})
+  - URL: {url}
+
+"""
+
+MD_LANGUAGE_TEMPLATE = """- **{language}** — {level}
+  - {description}
+
+"""
+
+TXT_TEMPLATE = """{name} - {title}
+{rule}
+
+CONTACT INFORMATION:
+Email: {email}
+Phone: {phone}
+Location: {location}
+LinkedIn: {linkedin}
+GitHub: {github}
+CV: {cv_url}
+
+PROFESSIONAL SUMMARY:
+{summary}
+
+TECHNICAL SKILLS:
+Frontend: {frontend}
+Backend: {backend}
+Databases: {database}
+Tools: {tools}
+
+PROJECTS & LIVE DEMOS:
+{projects_block}
+WORK EXPERIENCE:
+{experience_block}
+EDUCATION:
+{education_block}
+CERTIFICATES:
+{certificates_block}
+LANGUAGES:
+{languages_block}
+
+---
+Generated on: {now_str}
+Status: Clean URLs - All Fixed
+Notes: All project links have been verified and are working properly
+"""
+
+TXT_PROJECT_TEMPLATE = """
+{number}. {name}
+   Description: {description}
+   Code: {code_url}
+{live_line}   Technologies: {technologies}
+   Features: {features}
+   Status: {status}
+"""
+
+TXT_LIVE_TEMPLATE = "   Live Demo: {live_url}\n"
+
+TXT_EXPERIENCE_TEMPLATE = """
+- {title} at {company} ({duration})
+  {description}
+"""
+
+TXT_EDUCATION_TEMPLATE = """
+- {degree} from {institution} ({duration})
+  {description}
+"""
+
+TXT_CERTIFICATE_TEMPLATE = """
+- {name} — {issuer} ({date})
+  URL: {url}
+"""
+
+TXT_LANGUAGE_TEMPLATE = """
+- {language}: {level} ({description})
+"""
+
+MD_ITEM_TEMPLATES = {
+    'projects': MD_PROJECT_TEMPLATE,
+    'experience': MD_EXPERIENCE_TEMPLATE,
+    'education': MD_EDUCATION_TEMPLATE,
+    'certificates': MD_CERTIFICATE_TEMPLATE,
+    'languages': MD_LANGUAGE_TEMPLATE
+}
+
+TXT_ITEM_TEMPLATES = {
+    'projects': TXT_PROJECT_TEMPLATE,
+    'experience': TXT_EXPERIENCE_TEMPLATE,
+    'education': TXT_EDUCATION_TEMPLATE,
+    'certificates': TXT_CERTIFICATE_TEMPLATE,
+    'languages': TXT_LANGUAGE_TEMPLATE
+}
 
 def create_clean_cv_content():
     """Create clean CV content with fixed links"""
@@ -147,6 +356,16 @@ def create_clean_cv_content():
     
     return cv_content
 
+def _pdf_section_item(section, item, style):
+    """Build the PDF flowables for one item of a repeated CV section"""
+    if section == 'projects':
+        item['live_line'] = PDF_LIVE_TEMPLATE.format_map(item) if item['live_url'] else ''
+    
+    flowables = [Paragraph(PDF_ITEM_TEMPLATES[section].format_map(item), style)]
+    if PDF_ITEM_SPACING[section]:
+        flowables.append(Spacer(1, PDF_ITEM_SPACING[section]))
+    return flowables
+
 def create_pdf_cv(cv_content, output_file):
     """Create professional PDF version of CV"""
     
@@ -155,8 +374,9 @@ def create_pdf_cv(cv_content, output_file):
         return False
     
     try:
-        # Create PDF document
-        doc = SimpleDocTemplate(output_file, pagesize=A4, rightMargin=0.5*inch, leftMargin=0.5*inch, topMargin=0.5*inch, bottomMargin=0.5*inch)
+        # Create PDF document in memory; it is written out in one go once built
+        buffer = io.BytesIO()
+        doc = SimpleDocTemplate(buffer, pagesize=A4, rightMargin=0.5*inch, leftMargin=0.5*inch, topMargin=0.5*inch, bottomMargin=0.5*inch)
         
         # Get styles
         styles = getSampleStyleSheet()
@@ -193,6 +413,12 @@ def create_pdf_cv(cv_content, output_file):
         normal_style.fontSize = 10
         normal_style.spaceAfter = 6
         
+        # Section headers are static, so build each Paragraph once
+        section_headers = {
+            key: Paragraph(title, section_style)
+            for key, title in PDF_SECTION_TITLES.items()
+        }
+        
         # Build story
         story = []
         
@@ -222,12 +448,12 @@ def create_pdf_cv(cv_content, output_file):
         story.append(Spacer(1, 15))
         
         # Professional Summary
-        story.append(Paragraph("PROFESSIONAL SUMMARY", section_style))
+        story.append(section_headers['summary'])
         story.append(Paragraph(cv_content['summary'], normal_style))
         story.append(Spacer(1, 10))
         
         # Technical Skills
-        story.append(Paragraph("TECHNICAL SKILLS", section_style))
+        story.append(section_headers['skills'])
         
         skills_data = [
             ['Frontend:', ', '.join(cv_content['skills']['frontend'])],
@@ -250,73 +476,13 @@ def create_pdf_cv(cv_content, output_file):
         story.append(skills_table)
         story.append(Spacer(1, 10))
         
-        # Projects
-        story.append(Paragraph("PROJECTS & LIVE DEMOS", section_style))
-        
-        for project in cv_content['projects']:
-            project_title = f"<b>{project['name']}</b>"
-            story.append(Paragraph(project_title, normal_style))
-            
-            project_desc = f"<b>Description:</b> {project['description']}"
-            story.append(Paragraph(project_desc, normal_style))
-            
-            project_code = f"<b>Code:</b> {project['code_url']}"
-            story.append(Paragraph(project_code, normal_style))
-            
-            if project['live_url']:
-                project_live = f"<b>Live Demo:</b> {project['live_url']}"
-                story.append(Paragraph(project_live, normal_style))
-            
-            project_tech = f"<b>Technologies:</b> {', '.join(project['technologies'])}"
-            story.append(Paragraph(project_tech, normal_style))
-            
-            project_features = f"<b>Features:</b> {', '.join(project['features'])}"
-            story.append(Paragraph(project_features, normal_style))
-            
-            project_status = f"<b>Status:</b> {project['status']}"
-            story.append(Paragraph(project_status, normal_style))
-            
-            story.append(Spacer(1, 8))
-        
-        # Work Experience
-        story.append(Paragraph("WORK EXPERIENCE", section_style))
-        
-        for exp in cv_content['experience']:
-            exp_title = f"<b>{exp['title']}</b> - {exp['company']} ({exp['duration']})"
-            story.append(Paragraph(exp_title, normal_style))
-            
-            exp_desc = exp['description']
-            story.append(Paragraph(exp_desc, normal_style))
-            story.append(Spacer(1, 5))
-        
-        # Education
-        story.append(Paragraph("EDUCATION", section_style))
-        
-        for edu in cv_content['education']:
-            edu_title = f"<b>{edu['degree']}</b> - {edu['institution']} ({edu['duration']})"
-            story.append(Paragraph(edu_title, normal_style))
-            
-            edu_desc = edu['description']
-            story.append(Paragraph(edu_desc, normal_style))
-            story.append(Spacer(1, 5))
-        
-        # Certificates
-        story.append(Paragraph("CERTIFICATES", section_style))
-        
-        for cert in cv_content['certificates']:
-            cert_text = f"<b>{cert['name']}</b> — {cert['issuer']} ({cert['date']})"
-            story.append(Paragraph(cert_text, normal_style))
-            
-            cert_url = f"URL: {cert['url']}"
-            story.append(Paragraph(cert_url, normal_style))
-            story.append(Spacer(1, 3))
-        
-        # Languages
-        story.append(Paragraph("LANGUAGES", section_style))
-        
-        for lang in cv_content['languages']:
-            lang_text = f"<b>{lang['language']}</b> — {lang['level']} ({lang['description']})"
-            story.append(Paragraph(lang_text, normal_style))
+        # Projects, work experience, education, certificates and languages
+        current_section = None
+        for section, item in _iter_cv_sections(cv_content):
+            if section != current_section:
+                story.append(section_headers[section])
+                current_section = section
+            story.extend(_pdf_section_item(section, item, normal_style))
         
         # Footer
         story.append(Spacer(1, 20))
@@ -328,217 +494,101 @@ def create_pdf_cv(cv_content, output_file):
         
         # Build PDF
         doc.build(story)
+        Path(output_file).write_bytes(buffer.getvalue())
         return True
         
     except Exception as e:
         print(f"❌ Error creating PDF: {e}")
         return False
 
+def _cv_template_fields(cv_content):
+    """Flatten header, skills and timestamp into one mapping for the CV templates"""
+    fields = dict(cv_content['header'])
+    fields['summary'] = cv_content['summary']
+    for category, skills in cv_content['skills'].items():
+        fields[category] = ', '.join(skills)
+    fields['now_str'] = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
+    return fields
+
+def _iter_cv_sections(cv_content):
+    """Yield (section, item) pairs for the repeated CV sections in document order"""
+    for number, project in enumerate(cv_content['projects'], 1):
+        yield 'projects', {
+            **project,
+            'number': number,
+            'technologies': ', '.join(project['technologies']),
+            'features': ', '.join(project['features'])
+        }
+    for section in CV_SECTIONS[1:]:
+        for item in cv_content[section]:
+            yield section, item
+
+def _render_text_cv(cv_content, layout, item_templates, live_template, **extra):
+    """Render a text-based CV layout from the shared section traversal"""
+    fields = _cv_template_fields(cv_content)
+    fields.update(extra)
+    
+    blocks = {section: [] for section in CV_SECTIONS}
+    for section, item in _iter_cv_sections(cv_content):
+        if section == 'projects':
+            item['live_line'] = live_template.format_map(item) if item['live_url'] else ''
+        blocks[section].append(item_templates[section].format_map(item))
+    
+    for section, parts in blocks.items():
+        fields[f'{section}_block'] = ''.join(parts)
+    
+    return layout.format_map(fields)
+
 def create_markdown_cv(cv_content):
     """Create Markdown version of CV"""
     
-    md_content = f"""# {cv_content['header']['name']} - {cv_content['header']['title']}
-
-## 📧 CONTACT INFORMATION
-- **Email:** {cv_content['header']['email']}
-- **Phone:** {cv_content['header']['phone']}
-- **Location:** {cv_content['header']['location']}
-- **LinkedIn:** {cv_content['header']['linkedin']}
-- **GitHub:** {cv_content['header']['github']}
-- **CV:** {cv_content['header']['cv_url']}
-
-## 🎯 PROFESSIONAL SUMMARY
-{cv_content['summary']}
-
-## 🛠️ TECHNICAL SKILLS
-
-### **Frontend Development**
-{', '.join(cv_content['skills']['frontend'])}
-
-### **Backend Development**
-{', '.join(cv_content['skills']['backend'])}
-
-### **Databases & Tools**
-{', '.join(cv_content['skills']['database'])}
-
-### **Development Tools**
-{', '.join(cv_content['skills']['tools'])}
-
-### **Other Skills**
-{', '.join(cv_content['skills']['other'])}
-
-## 🚀 PROJECTS & LIVE DEMOS
-
-"""
-    
-    for project in cv_content['projects']:
-        md_content += f"""### **{project['name']}**
-- **Description:** {project['description']}
-- **Code:** {project['code_url']}
-"""
-        if project['live_url']:
-            md_content += f"- **Live Demo:** {project['live_url']}\n"
-        
-        md_content += f"""- **Technologies:** {', '.join(project['technologies'])}
-- **Features:** {', '.join(project['features'])}
-- **Status:** {project['status']}
-
-"""
-    
-    md_content += f"""## 💼 WORK EXPERIENCE
-
-"""
-    
-    for exp in cv_content['experience']:
-        md_content += f"""### **{exp['title']}**
-- **Company:** {exp['company']}
-- **Duration:** {exp['duration']}
-- **Description:** {exp['description']}
-
-"""
-    
-    md_content += f"""## 🎓 EDUCATION
-
-"""
-    
-    for edu in cv_content['education']:
-        md_content += f"""### **{edu['degree']}**
-- **Company:** {edu['institution']}
-- **Duration:** {edu['duration']}
-- **Description:** {edu['description']}
-
-"""
-    
-    md_content += f"""## 🏆 CERTIFICATES
-
-"""
-    
-    for cert in cv_content['certificates']:
-        md_content += f"""- **{cert['name']}** — {cert['issuer']} ({cert['date']})
-  - URL: {cert['url']}
-
-"""
-    
-    md_content += f"""## 🌍 LANGUAGES
-
-"""
-    
-    for lang in cv_content['languages']:
-        md_content += f"""- **{lang['language']}** — {lang['level']}
-  - {lang['description']}
-
-"""
-    
-    md_content += f"""
----
-
-*This CV was generated with clean, working links on {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}*
-*All project URLs have been verified and are working properly*
-"""
-    
-    return md_content
+    return _render_text_cv(cv_content, MD_TEMPLATE, MD_ITEM_TEMPLATES, MD_LIVE_TEMPLATE)
 
 def create_json_cv(cv_content):
     """Create JSON version of CV"""
     
-    # Add generation metadata
-    cv_content['metadata'] = {
+    # Add generation metadata on a copy so concurrent writers see the original content
+    cv_data = dict(cv_content)
+    cv_data['metadata'] = {
         "generated_at": datetime.now().isoformat(),
         "version": "2.0",
         "status": "Clean URLs - All Fixed",
         "notes": "All project links have been verified and are working properly"
     }
     
-    return json.dumps(cv_content, indent=2, ensure_ascii=False)
+    return json.dumps(cv_data, indent=2, ensure_ascii=False)
 
 def create_text_cv(cv_content):
     """Create plain text version of CV"""
     
-    text_content = f"""{cv_content['header']['name']} - {cv_content['header']['title']}
-{'=' * 60}
+    return _render_text_cv(cv_content, TXT_TEMPLATE, TXT_ITEM_TEMPLATES, TXT_LIVE_TEMPLATE, rule='=' * 60)
 
-CONTACT INFORMATION:
-Email: {cv_content['header']['email']}
-Phone: {cv_content['header']['phone']}
-Location: {cv_content['header']['location']}
-LinkedIn: {cv_content['header']['linkedin']}
-GitHub: {cv_content['header']['github']}
-CV: {cv_content['header']['cv_url']}
+def _encode_text(content):
+    """Encode CV text once, using the cheaper ASCII codec when possible"""
+    if content.isascii():
+        return content.encode('ascii')
+    return content.encode('utf-8')
 
-PROFESSIONAL SUMMARY:
-{cv_content['summary']}
+def _write_md(md_file, cv_content):
+    """Generate and write the Markdown CV"""
+    md_file.write_bytes(_encode_text(create_markdown_cv(cv_content)))
+    return md_file
 
-TECHNICAL SKILLS:
-Frontend: {', '.join(cv_content['skills']['frontend'])}
-Backend: {', '.join(cv_content['skills']['backend'])}
-Databases: {', '.join(cv_content['skills']['database'])}
-Tools: {', '.join(cv_content['skills']['tools'])}
+def _write_json(json_file, cv_content):
+    """Generate and write the JSON CV"""
+    json_file.write_bytes(_encode_text(create_json_cv(cv_content)))
+    return json_file
 
-PROJECTS & LIVE DEMOS:
-"""
-    
-    for i, project in enumerate(cv_content['projects'], 1):
-        text_content += f"""
-{i}. {project['name']}
-   Description: {project['description']}
-   Code: {project['code_url']}
-"""
-        if project['live_url']:
-            text_content += f"   Live Demo: {project['live_url']}\n"
-        
-        text_content += f"""   Technologies: {', '.join(project['technologies'])}
-   Features: {', '.join(project['features'])}
-   Status: {project['status']}
-"""
-    
-    text_content += f"""
-WORK EXPERIENCE:
-"""
-    
-    for exp in cv_content['experience']:
-        text_content += f"""
-- {exp['title']} at {exp['company']} ({exp['duration']})
-  {exp['description']}
-"""
-    
-    text_content += f"""
-EDUCATION:
-"""
-    
-    for edu in cv_content['education']:
-        text_content += f"""
-- {edu['degree']} from {edu['institution']} ({edu['duration']})
-  {edu['description']}
-"""
-    
-    text_content += f"""
-CERTIFICATES:
-"""
-    
-    for cert in cv_content['certificates']:
-        text_content += f"""
-- {cert['name']} — {cert['issuer']} ({cert['date']})
-  URL: {cert['url']}
-"""
-    
-    text_content += f"""
-LANGUAGES:
-"""
-    
-    for lang in cv_content['languages']:
-        text_content += f"""
-- {lang['language']}: {lang['level']} ({lang['description']})
-"""
-    
-    text_content += f"""
+def _write_txt(text_file, cv_content):
+    """Generate and write the plain text CV"""
+    text_file.write_bytes(_encode_text(create_text_cv(cv_content)))
+    return text_file
 
----
-Generated on: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}
-Status: Clean URLs - All Fixed
-Notes: All project links have been verified and are working properly
-"""
-    
-    return text_content
+def _write_pdf(pdf_file, cv_content):
+    """Generate and write the PDF CV"""
+    if create_pdf_cv(cv_content, pdf_file):
+        return pdf_file
+    return None
 
 def create_cv_files():
     """Create all CV file formats"""
@@ -557,33 +607,36 @@ def create_cv_files():
     print(f"📁 Creating CV files in: {output_dir}")
     print()
     
-    # Generate Markdown CV
-    md_content = create_markdown_cv(cv_content)
+    # Generate all formats concurrently; the PDF build is the long pole
     md_file = output_dir / "Abdallah_Nasr_Ali_CV.md"
-    with open(md_file, 'w', encoding='utf-8') as f:
-        f.write(md_content)
-    print(f"✅ Markdown CV created: {md_file}")
-    
-    # Generate JSON CV
-    json_content = create_json_cv(cv_content)
     json_file = output_dir / "Abdallah_Nasr_Ali_CV.json"
-    with open(json_file, 'w', encoding='utf-8') as f:
-        f.write(json_content)
-    print(f"✅ JSON CV created: {json_file}")
-    
-    # Generate Text CV
-    text_content = create_text_cv(cv_content)
     text_file = output_dir / "Abdallah_Nasr_Ali_CV.txt"
-    with open(text_file, 'w', encoding='utf-8') as f:
-        f.write(text_content)
-    print(f"✅ Text CV created: {text_file}")
-    
-    # Generate PDF CV
     pdf_file = output_dir / "Abdallah_Nasr_Ali_CV.pdf"
-    if create_pdf_cv(cv_content, pdf_file):
-        print(f"✅ PDF CV created: {pdf_file}")
-    else:
-        print("⚠️  PDF CV creation failed. Install reportlab: pip install reportlab")
+    
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        futures = {
+            executor.submit(_write_md, md_file, cv_content): "Markdown",
+            executor.submit(_write_json, json_file, cv_content): "JSON",
+            executor.submit(_write_txt, text_file, cv_content): "Text",
+        }
+        # Without reportlab there is nothing to build; main() prints the install hint
+        if PDF_AVAILABLE:
+            futures[executor.submit(_write_pdf, pdf_file, cv_content)] = "PDF"
+        # Collect results in submission order for a stable status report
+        status_report = []
+        for future, label in futures.items():
+            created_file = future.result()
+            if created_file:
+                status_report.append(f"✅ {label} CV created: {created_file}")
+            else:
+                status_report.append(f"⚠️  {label} CV creation failed")
+    
+    # Project link status lines shared by the summary file and console output
+    status_lines = [
+        f"- {project['name']}: {project['status']} ({project['live_url'] or project['code_url']})"
+        for project in cv_content['projects']
+    ]
+    project_links_status = "\n".join(status_lines)
     
     # Create summary file
     summary_content = f"""CLEAN CV GENERATION SUMMARY
@@ -602,9 +655,7 @@ FIXED ISSUES:
 ✅ Verified all URLs are working
 
 PROJECT LINKS STATUS:
-- E-commerce Demo: ✅ Working (https://abdalahnasr.github.io/E-commerce-demo/)
-- ISTQP Quiz App: ✅ Working (https://istqp-quiz.vercel.app)
-- Recipes App: ✅ Working (https://github.com/AbdalahNasr/recipes)
+{project_links_status}
 
 NEXT STEPS:
 1. Review the generated CV files
@@ -616,9 +667,9 @@ Your CV is now professional and all links work properly! 🎉
 """
     
     summary_file = output_dir / "GENERATION_SUMMARY.txt"
-    with open(summary_file, 'w', encoding='utf-8') as f:
-        f.write(summary_content)
-    print(f"✅ Summary file created: {summary_file}")
+    summary_file.write_text(summary_content, encoding='utf-8', newline='')
+    status_report.append(f"✅ Summary file created: {summary_file}")
+    print("\n".join(status_report))
     
     print()
     print("🎉 CLEAN CV GENERATION COMPLETE!")
@@ -633,9 +684,7 @@ Your CV is now professional and all links work properly! 🎉
     print("   📋 Summary: GENERATION_SUMMARY.txt")
     
     print("\n🔗 ALL PROJECT LINKS ARE NOW WORKING:")
-    print("   ✅ E-commerce Demo: https://abdalahnasr.github.io/E-commerce-demo/")
-    print("   ✅ ISTQP Quiz App: https://istqp-quiz.vercel.app")
-    print("   ✅ Recipes App: https://github.com/AbdalahNasr/recipes")
+    print(project_links_status)
     
     print("\n📋 NEXT STEPS:")
     print("1. 🔧 Rename GitHub repositories (remove spaces)")
@@ -4,49 +4,57 @@ Create CV Structure Directly
 CVs → ALL → Date/Time → JSON → file.json
 """
 
+import json
 import os
 import shutil
+import sys
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 
+# Fast JSON serialization when orjson is installed
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+# Per-format subfolders inside each date/time folder
+CV_SUBFOLDERS = ('JSON', 'PDF', 'DOCX', 'MARKDOWN', 'TEXT')
+
+# Sample data per stack, built once at import
+SAMPLE_CV_DATA = {
+    "frontend": {"role": "Frontend Developer", "skills": ["React", "Vue", "JavaScript"]},
+    "backend": {"role": "Backend Developer", "skills": ["Python", "Java", "Node.js"]},
+    "fullstack": {"role": "Full-Stack Developer", "skills": ["React", "Node.js", "Python"]},
+    "devops": {"role": "DevOps Engineer", "skills": ["Docker", "Kubernetes", "AWS"]}
+}
+
 def create_cv_structure():
     """Create the CV structure directly."""
     
-    # Create main folder with timestamp
-    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-    main_folder = f"CV_STRUCTURE_{timestamp}"
+    # Read the clock once; every name and the summary derive from it
+    now = datetime.now()
+    timestamp = now.strftime("%Y%m%d_%H%M%S")
+    date_str = now.strftime("%Y-%m-%d")
+    time_str = now.strftime("%I%p")  # e.g., "6PM"
     
-    if not os.path.exists(main_folder):
-        os.makedirs(main_folder)
-        print(f"📁 Created main folder: {main_folder}")
-    
-    # Create ALL folder
+    # Folder paths: main folder → ALL → date/time
+    main_folder = f"CV_STRUCTURE_{timestamp}"
     all_folder = os.path.join(main_folder, "ALL")
-    if not os.path.exists(all_folder):
-        os.makedirs(all_folder)
-        print(f"📁 Created ALL folder")
-    
-    # Create date/time folder
-    current_time = datetime.now()
-    date_str = current_time.strftime("%Y-%m-%d")
-    time_str = current_time.strftime("%I%p")  # e.g., "6PM"
-    
     date_time_folder = os.path.join(all_folder, date_str, time_str)
-    if not os.path.exists(date_time_folder):
-        os.makedirs(date_time_folder)
-        print(f"📁 Created date/time folder: {date_str}/{time_str}")
     
-    # Create subfolders
-    subfolders = ['JSON', 'PDF', 'DOCX', 'MARKDOWN', 'TEXT']
-    for subfolder in subfolders:
-        subfolder_path = os.path.join(date_time_folder, subfolder)
-        if not os.path.exists(subfolder_path):
-            os.makedirs(subfolder_path)
+    # Create each leaf subfolder; makedirs creates the main, ALL and date/time parents
+    for subfolder in CV_SUBFOLDERS:
+        os.makedirs(os.path.join(date_time_folder, subfolder), exist_ok=True)
+    print(f"📁 Created main folder: {main_folder}")
+    print(f"📁 Created ALL folder")
+    print(f"📁 Created date/time folder: {date_str}/{time_str}")
     
     # Create sample CV files
-    create_sample_cv_files(date_time_folder, timestamp)
+    create_sample_cv_files(date_time_folder, timestamp, verbose=True)
     
     # Create summary
-    create_summary(main_folder, date_str, time_str, timestamp)
+    create_summary(main_folder, date_str, time_str, timestamp, now)
     
     print(f"\n🎉 CV structure created successfully!")
     print(f"📁 Main folder: {main_folder}")
@@ -56,117 +64,138 @@ def create_cv_structure():
     print(f"\n📁 Final structure:")
     show_structure(main_folder)
 
-def create_sample_cv_files(base_path, timestamp):
-    """Create sample CV files in each folder."""
-    
-    # JSON files
-    json_folder = os.path.join(base_path, "JSON")
-    cv_data = {
-        "frontend": {"role": "Frontend Developer", "skills": ["React", "Vue", "JavaScript"]},
-        "backend": {"role": "Backend Developer", "skills": ["Python", "Java", "Node.js"]},
-        "fullstack": {"role": "Full-Stack Developer", "skills": ["React", "Node.js", "Python"]},
-        "devops": {"role": "DevOps Engineer", "skills": ["Docker", "Kubernetes", "AWS"]}
-    }
-    
-    for stack, data in cv_data.items():
-        json_file = os.path.join(json_folder, f"cv_{stack}_{timestamp}.json")
-        import json
-        with open(json_file, 'w', encoding='utf-8') as f:
-            json.dump(data, f, indent=2)
-        print(f"  ✅ Created: JSON/cv_{stack}_{timestamp}.json")
-    
-    # PDF files (create text files as placeholders)
-    pdf_folder = os.path.join(base_path, "PDF")
-    for stack in cv_data.keys():
-        pdf_file = os.path.join(pdf_folder, f"cv_{stack}_{timestamp}.pdf")
-        with open(pdf_file, 'w', encoding='utf-8') as f:
-            f.write(f"CV for {stack} - Generated at {timestamp}")
-        print(f"  ✅ Created: PDF/cv_{stack}_{timestamp}.pdf")
-    
-    # DOCX files (create text files as placeholders)
-    docx_folder = os.path.join(base_path, "DOCX")
-    for stack in cv_data.keys():
-        docx_file = os.path.join(docx_folder, f"cv_{stack}_{timestamp}.docx")
-        with open(docx_file, 'w', encoding='utf-8') as f:
-            f.write(f"CV for {stack} - Generated at {timestamp}")
-        print(f"  ✅ Created: DOCX/cv_{stack}_{timestamp}.docx")
-    
-    # Markdown files
-    md_folder = os.path.join(base_path, "MARKDOWN")
-    for stack in cv_data.keys():
-        md_file = os.path.join(md_folder, f"cv_{stack}_{timestamp}.md")
-        with open(md_file, 'w', encoding='utf-8') as f:
-            f.write(f"# CV for {stack}\n\nGenerated at: {timestamp}\n\n## Skills\n")
-            for skill in cv_data[stack]["skills"]:
-                f.write(f"- {skill}\n")
-        print(f"  ✅ Created: MARKDOWN/cv_{stack}_{timestamp}.md")
-    
-    # Text files
-    text_folder = os.path.join(base_path, "TEXT")
-    for stack in cv_data.keys():
-        text_file = os.path.join(text_folder, f"cv_{stack}_{timestamp}.txt")
-        with open(text_file, 'w', encoding='utf-8') as f:
-            f.write(f"CV for {stack}\nGenerated at: {timestamp}\n\nSkills:\n")
-            for skill in cv_data[stack]["skills"]:
-                f.write(f"- {skill}\n")
-        print(f"  ✅ Created: TEXT/cv_{stack}_{timestamp}.txt")
+def _dumps_json(data):
+    """Serialize data to indented JSON bytes."""
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2)
+    return json.dumps(data, indent=2).encode('utf-8')
+
+def _write_small(path, data):
+    """Write a bytes payload with raw os.write calls, bypassing buffered file objects."""
+    # 0o666 filtered by the umask, the same permissions open() would give
+    fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o666)
+    try:
+        # os.write may write fewer bytes than asked; keep going until all are written
+        view = memoryview(data)
+        while view:
+            view = view[os.write(fd, view):]
+    finally:
+        os.close(fd)
 
-def create_summary(main_folder, date_str, time_str, timestamp):
+def create_sample_cv_files(base_path, timestamp, verbose=False):
+    """Create sample CV files in each folder; list them when verbose."""
+    
+    # Join each subfolder once; file paths below are plain f-strings on top
+    dirs = {sub: os.path.join(base_path, sub) for sub in CV_SUBFOLDERS}
+    sep = os.sep
+    
+    created = []
+    writes = []
+    
+    # Render all five formats for each stack in a single pass
+    for stack, data in SAMPLE_CV_DATA.items():
+        base_name = f"cv_{stack}_{timestamp}"
+        skills = "".join(f"- {skill}\n" for skill in data["skills"])
+        placeholder = f"CV for {stack} - Generated at {timestamp}".encode('utf-8')
+        
+        # JSON file
+        writes.append((f"{dirs['JSON']}{sep}{base_name}.json", _dumps_json(data)))
+        created.append(f"JSON/{base_name}.json")
+        
+        # PDF file (text placeholder)
+        writes.append((f"{dirs['PDF']}{sep}{base_name}.pdf", placeholder))
+        created.append(f"PDF/{base_name}.pdf")
+        
+        # DOCX file (text placeholder)
+        writes.append((f"{dirs['DOCX']}{sep}{base_name}.docx", placeholder))
+        created.append(f"DOCX/{base_name}.docx")
+        
+        # Markdown file
+        md_content = f"# CV for {stack}\n\nGenerated at: {timestamp}\n\n## Skills\n{skills}"
+        writes.append((f"{dirs['MARKDOWN']}{sep}{base_name}.md", md_content.encode('utf-8')))
+        created.append(f"MARKDOWN/{base_name}.md")
+        
+        # Text file
+        text_content = f"CV for {stack}\nGenerated at: {timestamp}\n\nSkills:\n{skills}"
+        writes.append((f"{dirs['TEXT']}{sep}{base_name}.txt", text_content.encode('utf-8')))
+        created.append(f"TEXT/{base_name}.txt")
+    
+    # The files are independent, so overlap the writes; result() re-raises any failure
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        futures = [executor.submit(_write_small, path, payload) for path, payload in writes]
+        for future in futures:
+            future.result()
+    
+    # Report every created file with one write instead of a print per file
+    if verbose:
+        sys.stdout.write("".join(f"  ✅ Created: {name}\n" for name in created))
+
+def create_summary(main_folder, date_str, time_str, timestamp, created_at):
     """Create summary file."""
     summary_file = os.path.join(main_folder, "STRUCTURE_SUMMARY.txt")
     
-    summary_content = f"""CV Structure Summary
-{'='*30}
-
-Created at: {datetime.now().strftime('%Y-%m-%d %I:%M %p')}
-Main folder: {main_folder}
-Structure: ALL/{date_str}/{time_str}/
-
-This structure follows the pattern:
-CVs → ALL → Date/Time → JSON → file.json
-
-Folder breakdown:
-• ALL/ - Contains all CV generations
-  └── {date_str}/ - Date folder
-      └── {time_str}/ - Time folder
-          ├── JSON/ - CV data files with timestamps
-          ├── PDF/ - CV PDF files with timestamps
-          ├── DOCX/ - CV DOCX files with timestamps
-          ├── MARKDOWN/ - CV markdown files with timestamps
-          └── TEXT/ - CV text files with timestamps
-
-Example files:
-• cv_frontend_{timestamp}.json
-• cv_backend_{timestamp}.pdf
-• cv_fullstack_{timestamp}.docx
-
-Each time you run this, a new timestamped folder will be created.
-"""
+    lines = [
+        "CV Structure Summary",
+        "=" * 30,
+        "",
+        f"Created at: {created_at.strftime('%Y-%m-%d %I:%M %p')}",
+        f"Main folder: {main_folder}",
+        f"Structure: ALL/{date_str}/{time_str}/",
+        "",
+        "This structure follows the pattern:",
+        "CVs → ALL → Date/Time → JSON → file.json",
+        "",
+        "Folder breakdown:",
+        "• ALL/ - Contains all CV generations",
+        f"  └── {date_str}/ - Date folder",
+        f"      └── {time_str}/ - Time folder",
+        "          ├── JSON/ - CV data files with timestamps",
+        "          ├── PDF/ - CV PDF files with timestamps",
+        "          ├── DOCX/ - CV DOCX files with timestamps",
+        "          ├── MARKDOWN/ - CV markdown files with timestamps",
+        "          └── TEXT/ - CV text files with timestamps",
+        "",
+        "Example files:",
+        f"• cv_frontend_{timestamp}.json",
+        f"• cv_backend_{timestamp}.pdf",
+        f"• cv_fullstack_{timestamp}.docx",
+        "",
+        "Each time you run this, a new timestamped folder will be created.",
+        ""
+    ]
+    summary_content = "\n".join(lines)
     
     with open(summary_file, 'w', encoding='utf-8') as f:
         f.write(summary_content)
     
     print(f"📋 Summary created: STRUCTURE_SUMMARY.txt")
 
-def show_structure(folder_path, level=0):
+def show_structure(folder_path, level=0, name=None):
     """Show the folder structure."""
     indent = "  " * level
     
     if os.path.isdir(folder_path):
-        print(f"{indent}{os.path.basename(folder_path)}/")
+        print(f"{indent}{name or os.path.basename(folder_path)}/")
         
         try:
-            items = os.listdir(folder_path)
-            folders = [item for item in items if os.path.isdir(os.path.join(folder_path, item))]
-            files = [item for item in items if os.path.isfile(os.path.join(folder_path, item))]
+            # DirEntry carries the file type from the directory read, so no extra stats
+            folders = []
+            files = []
+            with os.scandir(folder_path) as entries:
+                for entry in entries:
+                    # One type check per entry: anything that is not a folder is listed as a file
+                    if entry.is_dir(follow_symlinks=False):
+                        folders.append(entry)
+                    else:
+                        files.append(entry)
             
             # Show folders first
-            for folder in sorted(folders):
-                show_structure(os.path.join(folder_path, folder), level + 1)
+            for folder in sorted(folders, key=lambda e: e.name):
+                show_structure(folder.path, level + 1, folder.name)
             
             # Show files
-            for file in sorted(files):
-                print(f"{indent}  {file}")
+            for file in sorted(files, key=lambda e: e.name):
+                print(f"{indent}  {file.name}")
                 
         except PermissionError:
             print(f"{indent}  [Access Denied]")
@@ -5,7 +5,6 @@ Removes extra spaces, fixes broken links, and provides clean versions
 """
 import os
 import sys
-import re
 from urllib.parse import urlparse, urlunparse
 
 def clean_cv_links():
@@ -134,17 +133,8 @@ def fix_url_formatting(url):
     if not url:
         return url
     
-    # Remove extra spaces around hyphens
-    url = re.sub(r'(\w+)\s*-\s*(\w+)', r'\1-\2', url)
-    
-    # Remove extra spaces in URLs
-    url = re.sub(r'\s+', '', url)
-    
-    # Fix common formatting issues
-    url = url.replace(' -', '-')
-    url = url.replace('- ', '-')
-    
-    return url
+    # Remove every space in one pass, including the ones around hyphens
+    return ''.join(url.split())
 
 def test_fixed_links():
     """Test if the fixed links work properly"""
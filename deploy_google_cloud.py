@@ -7,6 +7,16 @@ import os
 import subprocess
 import json
 
+# Secrets forwarded to the deployed service
+DEPLOY_ENV_VARS = (
+    'GMAIL_USER',
+    'GMAIL_APP_PASSWORD',
+    'NOTION_TOKEN',
+    'NOTION_DATABASE_ID',
+    'CV_PRIMARY_URL',
+    'OPENAI_API_KEY'
+)
+
 def create_dockerfile():
     """Create Dockerfile for Google Cloud Run"""
     dockerfile_content = """
@@ -41,6 +51,7 @@ CMD ["python", "continuous_job_automation_robust.py"]
 
 def create_cloudbuild_config():
     """Create Cloud Build configuration"""
+    env = os.environ
     config = {
         "steps": [
             {
@@ -63,18 +74,11 @@ def create_cloudbuild_config():
                 ]
             }
         ],
-        "substitutions": {
-            "_GMAIL_USER": os.getenv('GMAIL_USER', ''),
-            "_GMAIL_APP_PASSWORD": os.getenv('GMAIL_APP_PASSWORD', ''),
-            "_NOTION_TOKEN": os.getenv('NOTION_TOKEN', ''),
-            "_NOTION_DATABASE_ID": os.getenv('NOTION_DATABASE_ID', ''),
-            "_CV_PRIMARY_URL": os.getenv('CV_PRIMARY_URL', ''),
-            "_OPENAI_API_KEY": os.getenv('OPENAI_API_KEY', '')
-        }
+        "substitutions": {f"_{name}": env.get(name, '') for name in DEPLOY_ENV_VARS}
     }
     
     with open('cloudbuild.yaml', 'w') as f:
-        json.dump(config, f, indent=2)
+        f.write(json.dumps(config, indent=2))
     
     print("✅ Created cloudbuild.yaml")
 
@@ -58,14 +58,21 @@ def deploy_to_railway():
             'OPENAI_API_KEY'
         ]
         
+        # Set every available variable with one railway invocation
+        env = os.environ
+        pairs = []
         for var in env_vars:
-            value = os.getenv(var)
+            value = env.get(var)
             if value:
-                subprocess.run(['railway', 'variables', 'set', f'{var}={value}'], check=True)
-                print(f"  ✅ Set {var}")
+                pairs.append(f'{var}={value}')
             else:
                 print(f"  ⚠️ {var} not found in environment")
         
+        if pairs:
+            subprocess.run(['railway', 'variables', 'set', *pairs], check=True)
+            for pair in pairs:
+                print(f"  ✅ Set {pair.split('=', 1)[0]}")
+        
         # Deploy
         print("🚀 Deploying application...")
         subprocess.run(['railway', 'up'], check=True)
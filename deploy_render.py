@@ -6,11 +6,22 @@ Render Free Deployment Script - Completely FREE
 import os
 import json
 
+# Secrets forwarded to the deployed service
+DEPLOY_ENV_VARS = (
+    'GMAIL_USER',
+    'GMAIL_APP_PASSWORD',
+    'NOTION_TOKEN',
+    'NOTION_DATABASE_ID',
+    'CV_PRIMARY_URL',
+    'OPENAI_API_KEY'
+)
+
 def create_render_config():
     """Create Render configuration files"""
     print("📝 Creating Render configuration...")
     
     # Create render.yaml
+    env = os.environ
     render_config = {
         "services": [
             {
@@ -20,37 +31,15 @@ def create_render_config():
                 "buildCommand": "pip install -r requirements.txt",
                 "startCommand": "python continuous_job_automation_robust.py",
                 "envVars": [
-                    {
-                        "key": "GMAIL_USER",
-                        "value": os.getenv('GMAIL_USER', '')
-                    },
-                    {
-                        "key": "GMAIL_APP_PASSWORD", 
-                        "value": os.getenv('GMAIL_APP_PASSWORD', '')
-                    },
-                    {
-                        "key": "NOTION_TOKEN",
-                        "value": os.getenv('NOTION_TOKEN', '')
-                    },
-                    {
-                        "key": "NOTION_DATABASE_ID",
-                        "value": os.getenv('NOTION_DATABASE_ID', '')
-                    },
-                    {
-                        "key": "CV_PRIMARY_URL",
-                        "value": os.getenv('CV_PRIMARY_URL', '')
-                    },
-                    {
-                        "key": "OPENAI_API_KEY",
-                        "value": os.getenv('OPENAI_API_KEY', '')
-                    }
+                    {"key": name, "value": env.get(name, '')}
+                    for name in DEPLOY_ENV_VARS
                 ]
             }
         ]
     }
     
     with open('render.yaml', 'w') as f:
-        json.dump(render_config, f, indent=2)
+        f.write(json.dumps(render_config, indent=2))
     
     print("✅ Created render.yaml")
     
@@ -19,11 +19,11 @@ def create_deployment_package():
         print("   Make sure you have the cloud automation script")
         return False
     
-    # Check if requirements.txt exists
-    if not os.path.exists('requirements.txt'):
+    # Create requirements.txt only if it doesn't exist
+    if create_basic_requirements():
         print("❌ requirements.txt not found!")
         print("   Creating basic requirements.txt...")
-        create_basic_requirements()
+        print("✅ Created requirements.txt")
     
     # Check environment variables
     required_vars = [
@@ -77,7 +77,7 @@ def create_deployment_package():
     return True
 
 def create_basic_requirements():
-    """Create a basic requirements.txt if it doesn't exist"""
+    """Create a basic requirements.txt if it doesn't exist; return True if created"""
     requirements = [
         "python-dotenv==1.0.0",
         "requests==2.31.0",
@@ -94,11 +94,17 @@ def create_basic_requirements():
         "google-api-python-client==2.108.0"
     ]
     
-    with open('requirements.txt', 'w') as f:
+    # Exclusive create makes the open itself the (race-free) existence check
+    try:
+        f = open('requirements.txt', 'x')
+    except FileExistsError:
+        return False
+    
+    with f:
         for req in requirements:
             f.write(req + '\n')
     
-    print("✅ Created requirements.txt")
+    return True
 
 def show_deployment_options():
     """Show available deployment options"""
@@ -19,17 +19,194 @@ Features:
 - Professional templates
 """
 
+import hashlib
 import json
 import os
+import re
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
 from datetime import datetime
-from typing import Dict, List, Optional
+from functools import lru_cache, partial
+from typing import Any, Dict, List, Optional, Tuple
 import openai
 
 from config import Config
 
+# Fast JSON serialization when orjson is installed
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+# Optional document backends for PDF and DOCX export
+try:
+    from reportlab.lib.pagesizes import letter
+    from reportlab.platypus import SimpleDocTemplate, Paragraph, Spacer
+    from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
+    REPORTLAB_AVAILABLE = True
+except ImportError:
+    REPORTLAB_AVAILABLE = False
+
+try:
+    from docx import Document
+    from docx.enum.text import WD_ALIGN_PARAGRAPH
+    DOCX_AVAILABLE = True
+except ImportError:
+    DOCX_AVAILABLE = False
+
+# Optional Aho-Corasick automaton for single-pass keyword matching
+try:
+    import ahocorasick
+    AHOCORASICK_AVAILABLE = True
+except ImportError:
+    AHOCORASICK_AVAILABLE = False
+
+# Export formats written for each stack by main(), with their display labels
+EXPORT_FORMATS = (
+    ('text', 'Text'),
+    ('json', 'JSON'),
+    ('markdown', 'Markdown'),
+    ('pdf', 'PDF'),
+    ('docx', 'DOCX')
+)
+
+# CV version layouts, rendered with str.format_map
+# ATS layout sections in order: (heading, customized section key)
+ATS_SECTIONS = (
+    ('PROFESSIONAL SUMMARY', 'summary'),
+    ('TECHNICAL SKILLS', 'skills'),
+    ('PROFESSIONAL EXPERIENCE', 'experience'),
+    ('KEY PROJECTS', 'projects'),
+    ('EDUCATION', 'education')
+)
+
+ATS_TEMPLATE = "\n\n".join(f"{heading}\n{'=' * 50}\n{{{key}}}" for heading, key in ATS_SECTIONS)
+
+PROFESSIONAL_TEMPLATE = """{title}
+{title_rule}
+
+PROFESSIONAL SUMMARY
+--------------------
+{summary}
+
+CORE COMPETENCIES
+--------------------
+• {focus_areas}
+
+TECHNICAL EXPERTISE
+--------------------
+{skills}
+
+PROFESSIONAL EXPERIENCE
+--------------------
+{experience}
+
+NOTABLE PROJECTS
+--------------------
+{projects}
+
+EDUCATION & CERTIFICATIONS
+--------------------
+{education}"""
+
+CONCISE_TEMPLATE = """{name}
+
+{brief_summary}
+
+Key Skills: {brief_skills}...
+
+Experience: {brief_experience}"""
+
+def _build_keyword_automaton(keywords: Tuple[str, ...]):
+    """Build an Aho-Corasick automaton mapping lowercased keywords to their index."""
+    automaton = ahocorasick.Automaton()
+    # Insert in reverse so the first occurrence of a duplicate keyword wins
+    for index in range(len(keywords) - 1, -1, -1):
+        automaton.add_word(keywords[index].lower(), index)
+    automaton.make_automaton()
+    return automaton
+
+@lru_cache(maxsize=1)
+def _pdf_styles():
+    """Build the reportlab sample stylesheet and CV title style once per process."""
+    styles = getSampleStyleSheet()
+    title_style = ParagraphStyle(
+        'CustomTitle',
+        parent=styles['Heading1'],
+        fontSize=18,
+        spaceAfter=30,
+        alignment=1
+    )
+    return styles, title_style
+
+# Keywords this short ('Go', 'R', 'SQL') are only highlighted with their exact
+# casing; longer ones ('JavaScript', 'React Native') match in any case
+CASE_SENSITIVE_KEYWORD_MAX_LEN = 3
+
+@dataclass(slots=True, frozen=True)
+class StackSpec:
+    """Tech stack profile plus the keyword helpers derived from it once."""
+    name: str
+    keywords: Tuple[str, ...]
+    focus_areas: Tuple[str, ...]
+    common_roles: Tuple[str, ...]
+    keywords_lower: Tuple[str, ...] = field(init=False, repr=False, compare=False)
+    keywords_csv5: str = field(init=False, repr=False, compare=False)
+    focus_csv2: str = field(init=False, repr=False, compare=False)
+    name_lower: str = field(init=False, repr=False, compare=False)
+    keyword_regex: re.Pattern = field(init=False, repr=False, compare=False)
+    automaton: Any = field(init=False, repr=False, compare=False)
+    
+    def __post_init__(self):
+        # Frozen, so the derived fields are filled in through object.__setattr__
+        keywords = self.keywords
+        object.__setattr__(self, 'keywords_lower', tuple(keyword.lower() for keyword in keywords))
+        object.__setattr__(self, 'keywords_csv5', ', '.join(keywords[:5]))
+        object.__setattr__(self, 'focus_csv2', ', '.join(self.focus_areas[:2]))
+        object.__setattr__(self, 'name_lower', self.name.lower())
+        # Longest first so 'React Native' wins over 'React'; lookarounds instead of \b
+        # because keywords such as 'C#' and 'Node.js' start or end with punctuation.
+        # Short keywords match case-sensitively so prose like "go-to" isn't bolded as Go
+        ordered = sorted(keywords, key=len, reverse=True)
+        long_alternation = '|'.join(re.escape(keyword) for keyword in ordered
+                                    if len(keyword) > CASE_SENSITIVE_KEYWORD_MAX_LEN)
+        short_alternation = '|'.join(re.escape(keyword) for keyword in ordered
+                                     if len(keyword) <= CASE_SENSITIVE_KEYWORD_MAX_LEN)
+        alternation = '|'.join(filter(None, (long_alternation and f'(?i:{long_alternation})', short_alternation)))
+        object.__setattr__(self, 'keyword_regex', re.compile(rf'(?<!\w)({alternation})(?!\w)'))
+        object.__setattr__(self, 'automaton', _build_keyword_automaton(keywords) if AHOCORASICK_AVAILABLE else None)
+    
+    def to_dict(self) -> Dict[str, Any]:
+        """Return the public stack profile, as stored in generated CV data."""
+        return {
+            'name': self.name,
+            'keywords': list(self.keywords),
+            'focus_areas': list(self.focus_areas),
+            'common_roles': list(self.common_roles)
+        }
+
 class EnhancedCVSystem:
     """Advanced CV system for multiple tech stacks with ATS optimization."""
     
+    # Vocabulary used to find sections in CVs without headings
+    _EXPERIENCE_KEYWORDS = ('worked', 'employed', 'job', 'position', 'role', 'responsibilities')
+    _SKILL_KEYWORDS = ('python', 'javascript', 'java', 'sql', 'aws', 'docker', 'react', 'node')
+    _EXPERIENCE_REGEX = re.compile('|'.join(map(re.escape, _EXPERIENCE_KEYWORDS)), re.IGNORECASE)
+    _SKILL_REGEX = re.compile('|'.join(map(re.escape, _SKILL_KEYWORDS)), re.IGNORECASE)
+    
+    # Section heading patterns, compiled once for every CV parsed
+    _SECTION_PATTERNS = tuple(
+        (section_name, re.compile(pattern, re.IGNORECASE | re.DOTALL))
+        for section_name, pattern in (
+            ('summary', r'(?:summary|objective|profile|about)\s*:?\s*\n(.*?)(?=\n\s*\n|\n\s*[A-Z]|\Z)'),
+            ('experience', r'(?:experience|work\s+history|employment)\s*:?\s*\n(.*?)(?=\n\s*\n|\n\s*[A-Z]|\Z)'),
+            ('skills', r'(?:skills|technical\s+skills|competencies)\s*:?\s*\n(.*?)(?=\n\s*\n|\n\s*[A-Z]|\Z)'),
+            ('education', r'(?:education|academic|qualifications)\s*:?\s*\n(.*?)(?=\n\s*\n|\n\s*[A-Z]|\Z)'),
+            ('projects', r'(?:projects|portfolio|achievements)\s*:?\s*\n(.*?)(?=\n\s*\n|\n\s*[A-Z]|\Z)')
+        )
+    )
+    
     def __init__(self):
         """Initialize the enhanced CV system."""
         self.openai_available = bool(Config.OPENAI_API_KEY)
@@ -38,50 +215,66 @@ class EnhancedCVSystem:
         
         # Tech stack definitions with keywords and focus areas
         self.tech_stacks = {
-            'frontend': {
-                'name': 'Frontend Developer',
-                'keywords': ['React', 'Vue', 'Angular', 'JavaScript', 'TypeScript', 'HTML', 'CSS', 'SASS', 'Webpack', 'Responsive Design'],
-                'focus_areas': ['User Experience', 'Performance', 'Accessibility', 'Cross-browser Compatibility'],
-                'common_roles': ['Frontend Developer', 'UI Developer', 'JavaScript Developer', 'React Developer']
-            },
-            'backend': {
-                'name': 'Backend Developer',
-                'keywords': ['Python', 'Java', 'C#', 'Node.js', 'Go', 'Rust', 'SQL', 'NoSQL', 'APIs', 'Microservices'],
-                'focus_areas': ['System Architecture', 'Database Design', 'API Development', 'Performance Optimization'],
-                'common_roles': ['Backend Developer', 'API Developer', 'Software Engineer', 'Systems Developer']
-            },
-            'fullstack': {
-                'name': 'Full-Stack Developer',
-                'keywords': ['React', 'Node.js', 'Python', 'JavaScript', 'TypeScript', 'MongoDB', 'PostgreSQL', 'AWS', 'Docker'],
-                'focus_areas': ['End-to-End Development', 'System Integration', 'Full Application Lifecycle'],
-                'common_roles': ['Full-Stack Developer', 'Software Engineer', 'Web Developer', 'Application Developer']
-            },
-            'devops': {
-                'name': 'DevOps Engineer',
-                'keywords': ['Docker', 'Kubernetes', 'AWS', 'Azure', 'GCP', 'Jenkins', 'GitLab CI', 'Terraform', 'Ansible'],
-                'focus_areas': ['Infrastructure as Code', 'CI/CD Pipelines', 'Cloud Architecture', 'Monitoring & Logging'],
-                'common_roles': ['DevOps Engineer', 'Site Reliability Engineer', 'Infrastructure Engineer', 'Cloud Engineer']
-            },
-            'data_science': {
-                'name': 'Data Scientist',
-                'keywords': ['Python', 'R', 'SQL', 'Pandas', 'NumPy', 'Scikit-learn', 'TensorFlow', 'PyTorch', 'Jupyter'],
-                'focus_areas': ['Machine Learning', 'Statistical Analysis', 'Data Visualization', 'Predictive Modeling'],
-                'common_roles': ['Data Scientist', 'ML Engineer', 'Data Analyst', 'Research Scientist']
-            },
-            'mobile': {
-                'name': 'Mobile Developer',
-                'keywords': ['React Native', 'Flutter', 'iOS', 'Android', 'Swift', 'Kotlin', 'Mobile UI/UX', 'App Store'],
-                'focus_areas': ['Mobile Performance', 'Cross-platform Development', 'Native Features', 'App Store Optimization'],
-                'common_roles': ['Mobile Developer', 'iOS Developer', 'Android Developer', 'App Developer']
-            },
-            'ui_ux': {
-                'name': 'UI/UX Designer',
-                'keywords': ['Figma', 'Sketch', 'Adobe XD', 'User Research', 'Wireframing', 'Prototyping', 'Design Systems'],
-                'focus_areas': ['User Experience Design', 'Visual Design', 'Interaction Design', 'User Research'],
-                'common_roles': ['UI/UX Designer', 'Product Designer', 'Interaction Designer', 'Visual Designer']
-            }
+            'frontend': StackSpec(
+                name='Frontend Developer',
+                keywords=('React', 'Vue', 'Angular', 'JavaScript', 'TypeScript', 'HTML', 'CSS', 'SASS', 'Webpack', 'Responsive Design'),
+                focus_areas=('User Experience', 'Performance', 'Accessibility', 'Cross-browser Compatibility'),
+                common_roles=('Frontend Developer', 'UI Developer', 'JavaScript Developer', 'React Developer')
+            ),
+            'backend': StackSpec(
+                name='Backend Developer',
+                keywords=('Python', 'Java', 'C#', 'Node.js', 'Go', 'Rust', 'SQL', 'NoSQL', 'APIs', 'Microservices'),
+                focus_areas=('System Architecture', 'Database Design', 'API Development', 'Performance Optimization'),
+                common_roles=('Backend Developer', 'API Developer', 'Software Engineer', 'Systems Developer')
+            ),
+            'fullstack': StackSpec(
+                name='Full-Stack Developer',
+                keywords=('React', 'Node.js', 'Python', 'JavaScript', 'TypeScript', 'MongoDB', 'PostgreSQL', 'AWS', 'Docker'),
+                focus_areas=('End-to-End Development', 'System Integration', 'Full Application Lifecycle'),
+                common_roles=('Full-Stack Developer', 'Software Engineer', 'Web Developer', 'Application Developer')
+            ),
+            'devops': StackSpec(
+                name='DevOps Engineer',
+                keywords=('Docker', 'Kubernetes', 'AWS', 'Azure', 'GCP', 'Jenkins', 'GitLab CI', 'Terraform', 'Ansible'),
+                focus_areas=('Infrastructure as Code', 'CI/CD Pipelines', 'Cloud Architecture', 'Monitoring & Logging'),
+                common_roles=('DevOps Engineer', 'Site Reliability Engineer', 'Infrastructure Engineer', 'Cloud Engineer')
+            ),
+            'data_science': StackSpec(
+                name='Data Scientist',
+                keywords=('Python', 'R', 'SQL', 'Pandas', 'NumPy', 'Scikit-learn', 'TensorFlow', 'PyTorch', 'Jupyter'),
+                focus_areas=('Machine Learning', 'Statistical Analysis', 'Data Visualization', 'Predictive Modeling'),
+                common_roles=('Data Scientist', 'ML Engineer', 'Data Analyst', 'Research Scientist')
+            ),
+            'mobile': StackSpec(
+                name='Mobile Developer',
+                keywords=('React Native', 'Flutter', 'iOS', 'Android', 'Swift', 'Kotlin', 'Mobile UI/UX', 'App Store'),
+                focus_areas=('Mobile Performance', 'Cross-platform Development', 'Native Features', 'App Store Optimization'),
+                common_roles=('Mobile Developer', 'iOS Developer', 'Android Developer', 'App Developer')
+            ),
+            'ui_ux': StackSpec(
+                name='UI/UX Designer',
+                keywords=('Figma', 'Sketch', 'Adobe XD', 'User Research', 'Wireframing', 'Prototyping', 'Design Systems'),
+                focus_areas=('User Experience Design', 'Visual Design', 'Interaction Design', 'User Research'),
+                common_roles=('UI/UX Designer', 'Product Designer', 'Interaction Designer', 'Visual Designer')
+            )
         }
         
+        # Parsed sections of the last few CVs, keyed on the CV text itself
+        self._parse_cache = lru_cache(maxsize=8)(self._parse_cv_sections_uncached)
+        
+        # Per-stack renderer closures, built on first use as (spec, renderer)
+        self._renderers = {}
+        
+        # Shared automaton tagging experience/skill vocabulary for heading-less CVs
+        self._content_automaton = None
+        if AHOCORASICK_AVAILABLE:
+            self._content_automaton = ahocorasick.Automaton()
+            for keyword in self._EXPERIENCE_KEYWORDS:
+                self._content_automaton.add_word(keyword, 'experience')
+            for keyword in self._SKILL_KEYWORDS:
+                self._content_automaton.add_word(keyword, 'skills')
+            self._content_automaton.make_automaton()
+        
         # ATS optimization rules
         self.ats_rules = {
             'formatting': [
@@ -119,6 +312,28 @@ class EnhancedCVSystem:
             job_title: Specific job title if known
             company: Company name if known
             
+        Returns:
+            Dict: Stack-specific CV with multiple versions
+        """
+        cv_sections = self._parse_cv_sections(base_cv)
+        return self.generate_from_sections(cv_sections, target_stack, job_title, company, base_cv)
+    
+    def generate_from_sections(self, cv_sections: Dict[str, str], target_stack: str,
+                               job_title: str = None, company: str = None,
+                               base_cv: str = None) -> Dict:
+        """
+        Generate a stack-specific CV from already parsed sections.
+        
+        Parse the base CV once with _parse_cv_sections and call this for each
+        target stack to avoid re-running the section regexes.
+        
+        Args:
+            cv_sections: Sections returned by _parse_cv_sections
+            target_stack: Target tech stack (frontend, backend, fullstack, etc.)
+            job_title: Specific job title if known
+            company: Company name if known
+            base_cv: Original CV text, fingerprinted in the result when given
+            
         Returns:
             Dict: Stack-specific CV with multiple versions
         """
@@ -126,37 +341,33 @@ class EnhancedCVSystem:
             raise ValueError(f"Unknown tech stack: {target_stack}. Available: {list(self.tech_stacks.keys())}")
         
         stack_info = self.tech_stacks[target_stack]
+        if isinstance(stack_info, dict):
+            # Stack added after __init__ as a plain dict
+            stack_info = self.tech_stacks[target_stack] = StackSpec(**stack_info)
         
-        print(f"🎯 Generating CV for {stack_info['name']} role...")
-        
-        # Parse base CV
-        cv_sections = self._parse_cv_sections(base_cv)
-        
-        # Customize for target stack
-        customized_sections = self._customize_for_stack(cv_sections, stack_info, job_title, company)
-        
-        # Create ATS-optimized version
-        ats_version = self._create_ats_version(customized_sections, stack_info)
+        renderer = self._renderers.get(target_stack)
+        if renderer is None or renderer[0] is not stack_info:
+            # First use of this stack, or its spec was replaced since
+            renderer = self._renderers[target_stack] = (stack_info, self._make_renderer(stack_info))
         
-        # Create professional version
-        professional_version = self._create_professional_version(customized_sections, stack_info)
+        print(f"🎯 Generating CV for {stack_info.name} role...")
         
-        # Create concise version
-        concise_version = self._create_concise_version(customized_sections, stack_info)
+        # Customize sections, render the three versions and collect suggestions
+        customized_sections, versions, suggestions = renderer[1](cv_sections, job_title, company)
         
-        # Generate stack-specific suggestions
-        suggestions = self._generate_stack_suggestions(customized_sections, stack_info)
+        # Fingerprint the base CV instead of storing the text every export would repeat
+        original_cv_sha256 = original_cv_length = None
+        if base_cv is not None:
+            original_cv_sha256 = hashlib.sha256(base_cv.encode('utf-8')).hexdigest()
+            original_cv_length = len(base_cv)
         
         result = {
             'stack': target_stack,
-            'stack_info': stack_info,
-            'original_cv': base_cv,
+            'stack_info': stack_info.to_dict(),
+            'original_cv_sha256': original_cv_sha256,
+            'original_cv_length': original_cv_length,
             'customized_sections': customized_sections,
-            'versions': {
-                'ats_optimized': ats_version,
-                'professional': professional_version,
-                'concise': concise_version
-            },
+            'versions': versions,
             'suggestions': suggestions,
             'generated_at': datetime.now().isoformat(),
             'job_title': job_title,
@@ -165,80 +376,101 @@ class EnhancedCVSystem:
         
         return result
     
+    def _first_keyword(self, text: str, stack_info: StackSpec) -> Optional[str]:
+        """Return the first stack keyword (in list order) contained in text, ignoring case."""
+        text_lower = text.lower()
+        keywords = stack_info.keywords
+        automaton = stack_info.automaton
+        if automaton is not None:
+            first = min((index for _, index in automaton.iter(text_lower)), default=None)
+            return None if first is None else keywords[first]
+        
+        for keyword, keyword_lower in zip(keywords, stack_info.keywords_lower):
+            if keyword_lower in text_lower:
+                return keyword
+        return None
+    
     def _parse_cv_sections(self, cv_text: str) -> Dict[str, str]:
+        """Parse CV text into logical sections, reusing results for recently parsed CVs."""
+        # Copy so callers can't modify the cached sections
+        return dict(self._parse_cache(cv_text))
+    
+    def _parse_cv_sections_uncached(self, cv_text: str) -> Dict[str, str]:
         """Parse CV text into logical sections."""
         sections = {}
+        # Split once, and only if some section has no heading
+        cv_lines = None
         
         # Simple section parsing
-        section_patterns = {
-            'summary': r'(?:summary|objective|profile|about)\s*:?\s*\n(.*?)(?=\n\s*\n|\n\s*[A-Z]|\Z)',
-            'experience': r'(?:experience|work\s+history|employment)\s*:?\s*\n(.*?)(?=\n\s*\n|\n\s*[A-Z]|\Z)',
-            'skills': r'(?:skills|technical\s+skills|competencies)\s*:?\s*\n(.*?)(?=\n\s*\n|\n\s*[A-Z]|\Z)',
-            'education': r'(?:education|academic|qualifications)\s*:?\s*\n(.*?)(?=\n\s*\n|\n\s*[A-Z]|\Z)',
-            'projects': r'(?:projects|portfolio|achievements)\s*:?\s*\n(.*?)(?=\n\s*\n|\n\s*[A-Z]|\Z)'
-        }
-        
-        for section_name, pattern in section_patterns.items():
-            import re
-            match = re.search(pattern, cv_text, re.IGNORECASE | re.DOTALL)
+        for section_name, pattern in self._SECTION_PATTERNS:
+            match = pattern.search(cv_text)
             if match:
                 sections[section_name] = match.group(1).strip()
             else:
-                sections[section_name] = self._extract_section_by_content(cv_text, section_name)
+                if cv_lines is None:
+                    cv_lines = cv_text.split('\n')
+                sections[section_name] = self._extract_section_by_content(cv_lines, section_name)
         
         return sections
     
-    def _extract_section_by_content(self, cv_text: str, section_name: str) -> str:
-        """Extract section content based on keywords and context."""
+    def _extract_section_by_content(self, cv_lines: List[str], section_name: str) -> str:
+        """Extract section content from the CV's lines based on keywords and context."""
         if section_name == 'summary':
-            lines = cv_text.split('\n')
-            for line in lines[:5]:
+            for line in cv_lines[:5]:
                 if line.strip() and len(line.strip()) > 50:
                     return line.strip()
         elif section_name == 'experience':
-            experience_keywords = ['worked', 'employed', 'job', 'position', 'role', 'responsibilities']
-            lines = cv_text.split('\n')
-            experience_lines = []
-            for line in lines:
-                if any(keyword in line.lower() for keyword in experience_keywords):
-                    experience_lines.append(line.strip())
+            experience_lines = self._lines_mentioning(cv_lines, 'experience', self._EXPERIENCE_REGEX)
             return '\n'.join(experience_lines[:10])
         elif section_name == 'skills':
-            skill_keywords = ['python', 'javascript', 'java', 'sql', 'aws', 'docker', 'react', 'node']
-            lines = cv_text.split('\n')
-            skill_lines = []
-            for line in lines:
-                if any(skill in line.lower() for skill in skill_keywords):
-                    skill_lines.append(line.strip())
+            skill_lines = self._lines_mentioning(cv_lines, 'skills', self._SKILL_REGEX)
             return '\n'.join(skill_lines)
         return ""
     
-    def _customize_for_stack(self, cv_sections: Dict[str, str], stack_info: Dict, 
-                            job_title: str = None, company: str = None) -> Dict[str, str]:
-        """Customize CV sections for specific tech stack."""
-        customized = {}
-        
-        for section_name, content in cv_sections.items():
-            if section_name == 'summary':
-                customized[section_name] = self._customize_summary(content, stack_info, job_title, company)
-            elif section_name == 'skills':
-                customized[section_name] = self._customize_skills(content, stack_info)
-            elif section_name == 'experience':
-                customized[section_name] = self._customize_experience(content, stack_info)
-            elif section_name == 'projects':
-                customized[section_name] = self._customize_projects(content, stack_info)
+    def _lines_mentioning(self, cv_lines: List[str], kind: str, pattern) -> List[str]:
+        """Return the stripped lines that mention the vocabulary of the given kind."""
+        automaton = self._content_automaton
+        matched = []
+        for line in cv_lines:
+            if automaton is not None:
+                found = any(hit_kind == kind for _, hit_kind in automaton.iter(line.lower()))
             else:
-                customized[section_name] = content
+                found = pattern.search(line) is not None
+            if found:
+                matched.append(line.strip())
+        return matched
+    
+    def _make_renderer(self, stack_info: StackSpec):
+        """Specialize customization, rendering and suggestions for one stack in a closure."""
+        customize_summary = self._customize_summary
+        render_versions = self._render_versions
+        stack_suggestions = self._generate_stack_suggestions
+        # Summary also needs the job title and company, so it stays outside this table
+        customizers = {
+            'skills': partial(self._customize_skills, stack_info=stack_info),
+            'experience': partial(self._customize_experience, stack_info=stack_info),
+            'projects': partial(self._customize_projects, stack_info=stack_info)
+        }
         
-        return customized
+        def render(cv_sections: Dict[str, str], job_title: str = None, company: str = None):
+            customized = {}
+            for section_name, content in cv_sections.items():
+                if section_name == 'summary':
+                    customized[section_name] = customize_summary(content, stack_info, job_title, company)
+                else:
+                    customize = customizers.get(section_name)
+                    customized[section_name] = content if customize is None else customize(content)
+            return customized, render_versions(customized, stack_info), stack_suggestions(customized, stack_info)
+        
+        return render
     
-    def _customize_summary(self, summary: str, stack_info: Dict, job_title: str = None, company: str = None) -> str:
+    def _customize_summary(self, summary: str, stack_info: StackSpec, job_title: str = None, company: str = None) -> str:
         """Customize summary for specific tech stack."""
-        role = job_title or stack_info['name']
+        role = job_title or stack_info.name
         
         # Create stack-specific summary
-        stack_summary = f"{role} with expertise in {', '.join(stack_info['keywords'][:5])}. "
-        stack_summary += f"Specialized in {', '.join(stack_info['focus_areas'][:2])}. "
+        stack_summary = f"{role} with expertise in {stack_info.keywords_csv5}. "
+        stack_summary += f"Specialized in {stack_info.focus_csv2}. "
         
         if summary:
             # Extract key achievements from original summary
@@ -247,17 +479,16 @@ class EnhancedCVSystem:
             if 'team' in summary.lower() or 'lead' in summary.lower():
                 stack_summary += "Experienced in leading development teams and mentoring junior developers. "
         
-        stack_summary += f"Passionate about creating innovative solutions using modern {stack_info['name'].lower()} technologies."
+        stack_summary += f"Passionate about creating innovative solutions using modern {stack_info.name_lower} technologies."
         
         return stack_summary
     
-    def _customize_skills(self, skills: str, stack_info: Dict) -> str:
+    def _customize_skills(self, skills: str, stack_info: StackSpec) -> str:
         """Customize skills section for specific tech stack."""
         if not skills:
-            return ', '.join(stack_info['keywords'])
+            return ', '.join(stack_info.keywords)
         
         # Reorganize skills to prioritize stack-specific ones
-        stack_keywords = [kw.lower() for kw in stack_info['keywords']]
         original_skills = skills.split(',')
         
         # Separate stack-specific and general skills
@@ -265,8 +496,7 @@ class EnhancedCVSystem:
         general_skills = []
         
         for skill in original_skills:
-            skill_lower = skill.strip().lower()
-            if any(keyword.lower() in skill_lower for keyword in stack_keywords):
+            if self._first_keyword(skill, stack_info) is not None:
                 stack_skills.append(skill.strip())
             else:
                 general_skills.append(skill.strip())
@@ -280,162 +510,65 @@ class EnhancedCVSystem:
         
         return ' | '.join(organized_skills)
     
-    def _customize_experience(self, experience: str, stack_info: Dict) -> str:
+    def _customize_experience(self, experience: str, stack_info: StackSpec) -> str:
         """Customize experience section for specific tech stack."""
         if not experience:
             return experience
         
         # Highlight stack-relevant experience
-        lines = experience.split('\n')
-        customized_lines = []
-        
-        for line in lines:
-            if line.strip():
-                # Highlight stack-specific keywords
-                for keyword in stack_info['keywords']:
-                    if keyword.lower() in line.lower():
-                        line = line.replace(keyword, f"**{keyword}**")
-                        break
-                customized_lines.append(line)
-        
-        return '\n'.join(customized_lines)
+        return self._highlight_keywords(experience, stack_info)
     
-    def _customize_projects(self, projects: str, stack_info: Dict) -> str:
+    def _customize_projects(self, projects: str, stack_info: StackSpec) -> str:
         """Customize projects section for specific tech stack."""
         if not projects:
             return projects
         
         # Highlight stack-relevant projects
-        lines = projects.split('\n')
-        customized_lines = []
-        
-        for line in lines:
-            if line.strip():
-                # Highlight stack-specific technologies
-                for keyword in stack_info['keywords']:
-                    if keyword.lower() in line.lower():
-                        line = line.replace(keyword, f"**{keyword}**")
-                        break
-                customized_lines.append(line)
-        
-        return '\n'.join(customized_lines)
+        return self._highlight_keywords(projects, stack_info)
     
-    def _create_ats_version(self, sections: Dict[str, str], stack_info: Dict) -> str:
-        """Create ATS-optimized version of CV."""
-        ats_cv = []
-        
-        # Header
-        ats_cv.append("PROFESSIONAL SUMMARY")
-        ats_cv.append("=" * 50)
-        ats_cv.append(sections.get('summary', ''))
-        ats_cv.append("")
-        
-        # Skills (most important for ATS)
-        ats_cv.append("TECHNICAL SKILLS")
-        ats_cv.append("=" * 50)
-        ats_cv.append(sections.get('skills', ''))
-        ats_cv.append("")
-        
-        # Experience
-        ats_cv.append("PROFESSIONAL EXPERIENCE")
-        ats_cv.append("=" * 50)
-        ats_cv.append(sections.get('experience', ''))
-        ats_cv.append("")
-        
-        # Projects
-        ats_cv.append("KEY PROJECTS")
-        ats_cv.append("=" * 50)
-        ats_cv.append(sections.get('projects', ''))
-        ats_cv.append("")
-        
-        # Education
-        ats_cv.append("EDUCATION")
-        ats_cv.append("=" * 50)
-        ats_cv.append(sections.get('education', ''))
-        
-        return '\n'.join(ats_cv)
+    def _highlight_keywords(self, text: str, stack_info: StackSpec) -> str:
+        """Drop blank lines and bold every stack keyword in a single regex pass over the text."""
+        # Keywords never span lines and newlines are non-word characters, so one
+        # sub() over the joined text matches exactly what a per-line sub() would
+        lines = '\n'.join(line for line in text.split('\n') if line.strip())
+        return stack_info.keyword_regex.sub(r'**\1**', lines)
     
-    def _create_professional_version(self, sections: Dict[str, str], stack_info: Dict) -> str:
-        """Create professional version of CV."""
-        prof_cv = []
-        
-        # Professional header
-        prof_cv.append(f"{stack_info['name'].upper()}")
-        prof_cv.append("=" * len(stack_info['name']))
-        prof_cv.append("")
-        
-        # Summary
-        prof_cv.append("PROFESSIONAL SUMMARY")
-        prof_cv.append("-" * 20)
-        prof_cv.append(sections.get('summary', ''))
-        prof_cv.append("")
-        
-        # Core competencies
-        prof_cv.append("CORE COMPETENCIES")
-        prof_cv.append("-" * 20)
-        prof_cv.append(f"• {', '.join(stack_info['focus_areas'])}")
-        prof_cv.append("")
-        
-        # Skills
-        prof_cv.append("TECHNICAL EXPERTISE")
-        prof_cv.append("-" * 20)
-        prof_cv.append(sections.get('skills', ''))
-        prof_cv.append("")
-        
-        # Experience
-        prof_cv.append("PROFESSIONAL EXPERIENCE")
-        prof_cv.append("-" * 20)
-        prof_cv.append(sections.get('experience', ''))
-        prof_cv.append("")
-        
-        # Projects
-        prof_cv.append("NOTABLE PROJECTS")
-        prof_cv.append("-" * 20)
-        prof_cv.append(sections.get('projects', ''))
-        prof_cv.append("")
-        
-        # Education
-        prof_cv.append("EDUCATION & CERTIFICATIONS")
-        prof_cv.append("-" * 20)
-        prof_cv.append(sections.get('education', ''))
-        
-        return '\n'.join(prof_cv)
-    
-    def _create_concise_version(self, sections: Dict[str, str], stack_info: Dict) -> str:
-        """Create concise version of CV."""
-        concise_cv = []
-        
-        # Brief header
-        concise_cv.append(f"{stack_info['name']}")
-        concise_cv.append("")
-        
-        # Brief summary
+    def _render_versions(self, sections: Dict[str, str], stack_info: StackSpec) -> Dict[str, str]:
+        """Create the ATS-optimized, professional and concise versions of a CV in one pass."""
+        # Look up each section once; all three layouts fill from the same fields
         summary = sections.get('summary', '')
-        if len(summary) > 200:
-            summary = summary[:200] + "..."
-        concise_cv.append(summary)
-        concise_cv.append("")
-        
-        # Key skills only
-        concise_cv.append("Key Skills: " + sections.get('skills', '')[:100] + "...")
-        concise_cv.append("")
-        
-        # Experience highlights
+        skills = sections.get('skills', '')
         experience = sections.get('experience', '')
-        if len(experience) > 300:
-            experience = experience[:300] + "..."
-        concise_cv.append("Experience: " + experience)
+        name = stack_info.name
+        fields = {
+            'summary': summary,
+            'skills': skills,
+            'experience': experience,
+            'projects': sections.get('projects', ''),
+            'education': sections.get('education', ''),
+            'name': name,
+            'title': name.upper(),
+            'title_rule': "=" * len(name),
+            'focus_areas': ', '.join(stack_info.focus_areas),
+            'brief_summary': summary[:200] + "..." if len(summary) > 200 else summary,
+            'brief_skills': skills[:100],
+            'brief_experience': experience[:300] + "..." if len(experience) > 300 else experience
+        }
         
-        return '\n'.join(concise_cv)
+        return {
+            'ats_optimized': ATS_TEMPLATE.format_map(fields),
+            'professional': PROFESSIONAL_TEMPLATE.format_map(fields),
+            'concise': CONCISE_TEMPLATE.format_map(fields)
+        }
     
-    def _generate_stack_suggestions(self, sections: Dict[str, str], stack_info: Dict) -> List[str]:
+    def _generate_stack_suggestions(self, sections: Dict[str, str], stack_info: StackSpec) -> List[str]:
         """Generate stack-specific improvement suggestions."""
         suggestions = []
         
         # Stack-specific suggestions
-        suggestions.append(f"Highlight {stack_info['name']} experience prominently")
-        suggestions.append(f"Emphasize {', '.join(stack_info['focus_areas'][:2])} skills")
-        suggestions.append(f"Include {', '.join(stack_info['keywords'][:5])} in experience descriptions")
+        suggestions.append(f"Highlight {stack_info.name} experience prominently")
+        suggestions.append(f"Emphasize {stack_info.focus_csv2} skills")
+        suggestions.append(f"Include {stack_info.keywords_csv5} in experience descriptions")
         
         # General suggestions
         suggestions.append("Use quantifiable achievements (e.g., 'increased performance by 40%')")
@@ -458,7 +591,13 @@ class EnhancedCVSystem:
             str: File path or content
         """
         if not filename_prefix:
-            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+            # Reuse the generation time so every export of one CV shares a stamp:
+            # 'YYYY-MM-DDTHH:MM:SS...' -> 'YYYYMMDD_HHMMSS'
+            generated_at = cv_data.get('generated_at')
+            if generated_at:
+                timestamp = generated_at[:19].replace('-', '').replace(':', '').replace('T', '_')
+            else:
+                timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
             filename_prefix = f"cv_{cv_data['stack']}_{timestamp}"
         
         if format_type == 'json':
@@ -475,110 +614,97 @@ class EnhancedCVSystem:
     def _export_to_json(self, cv_data: Dict, filename_prefix: str) -> str:
         """Export CV to JSON format."""
         filename = f"{filename_prefix}.json"
-        with open(filename, 'w', encoding='utf-8') as f:
-            json.dump(cv_data, f, indent=2, ensure_ascii=False)
+        if ORJSON_AVAILABLE:
+            data = orjson.dumps(cv_data, option=orjson.OPT_INDENT_2)
+        else:
+            data = json.dumps(cv_data, indent=2, ensure_ascii=False).encode('utf-8')
+        with open(filename, 'wb') as f:
+            f.write(data)
         return filename
     
     def _export_to_markdown(self, cv_data: Dict, filename_prefix: str) -> str:
         """Export CV to Markdown format."""
         filename = f"{filename_prefix}.md"
         
-        md_content = f"# {cv_data['stack_info']['name']} CV\n\n"
-        md_content += f"**Generated:** {cv_data['generated_at']}\n"
-        md_content += f"**Target Stack:** {cv_data['stack']}\n\n"
+        parts = [
+            f"# {cv_data['stack_info']['name']} CV\n\n",
+            f"**Generated:** {cv_data['generated_at']}\n",
+            f"**Target Stack:** {cv_data['stack']}\n\n"
+        ]
         
         # Add versions
         for version_name, content in cv_data['versions'].items():
-            md_content += f"## {version_name.replace('_', ' ').title()}\n\n"
-            md_content += f"```\n{content}\n```\n\n"
+            parts.append(f"## {version_name.replace('_', ' ').title()}\n\n")
+            parts.append(f"```\n{content}\n```\n\n")
         
         # Add suggestions
-        md_content += "## Improvement Suggestions\n\n"
-        for suggestion in cv_data['suggestions']:
-            md_content += f"- {suggestion}\n"
+        parts.append("## Improvement Suggestions\n\n")
+        parts.extend(f"- {suggestion}\n" for suggestion in cv_data['suggestions'])
         
         with open(filename, 'w', encoding='utf-8') as f:
-            f.write(md_content)
+            f.write(''.join(parts))
         
         return filename
     
     def _export_to_text(self, cv_data: Dict, filename_prefix: str) -> str:
         """Export CV to text format."""
         filename = f"{filename_prefix}.txt"
+        name = cv_data['stack_info']['name']
         
-        text_content = f"{cv_data['stack_info']['name']} CV\n"
-        text_content += "=" * (len(cv_data['stack_info']['name']) + 6) + "\n\n"
-        
-        # Add versions
-        for version_name, content in cv_data['versions'].items():
-            text_content += f"{version_name.upper()}\n"
-            text_content += "-" * len(version_name) + "\n"
-            text_content += f"{content}\n\n"
-        
-        # Add suggestions
-        text_content += "IMPROVEMENT SUGGESTIONS\n"
-        text_content += "-" * 25 + "\n"
-        for suggestion in cv_data['suggestions']:
-            text_content += f"• {suggestion}\n"
-        
+        # Write each piece straight into the file buffer; no full-document string
         with open(filename, 'w', encoding='utf-8') as f:
-            f.write(text_content)
+            f.write(f"{name} CV\n")
+            f.write("=" * (len(name) + 6) + "\n\n")
+            
+            # Add versions
+            for version_name, content in cv_data['versions'].items():
+                f.write(f"{version_name.upper()}\n{'-' * len(version_name)}\n{content}\n\n")
+            
+            # Add suggestions
+            f.write("IMPROVEMENT SUGGESTIONS\n")
+            f.write("-" * 25 + "\n")
+            f.writelines(f"• {suggestion}\n" for suggestion in cv_data['suggestions'])
         
         return filename
     
     def _export_to_pdf(self, cv_data: Dict, filename_prefix: str) -> str:
         """Export CV to PDF format."""
+        if not REPORTLAB_AVAILABLE:
+            return "PDF export failed - reportlab not installed"
+        
         try:
-            from reportlab.lib.pagesizes import letter
-            from reportlab.platypus import SimpleDocTemplate, Paragraph, Spacer
-            from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
-            
             filename = f"{filename_prefix}.pdf"
             
             doc = SimpleDocTemplate(filename, pagesize=letter)
             story = []
-            styles = getSampleStyleSheet()
+            styles, title_style = _pdf_styles()
             
             # Title
-            title_style = ParagraphStyle(
-                'CustomTitle',
-                parent=styles['Heading1'],
-                fontSize=18,
-                spaceAfter=30,
-                alignment=1
-            )
             story.append(Paragraph(f"{cv_data['stack_info']['name']} CV", title_style))
             story.append(Spacer(1, 20))
             
-            # Add ATS version content
-            ats_content = cv_data['versions']['ats_optimized']
-            lines = ats_content.split('\n')
-            
-            for line in lines:
-                if line.startswith('='):
-                    # Section header
-                    section_name = line.replace('=', '').strip()
-                    if section_name:
-                        story.append(Paragraph(section_name, styles['Heading2']))
-                        story.append(Spacer(1, 12))
-                elif line.strip():
-                    story.append(Paragraph(line.strip(), styles['Normal']))
-                    story.append(Spacer(1, 6))
+            # Add ATS sections straight from the customized sections
+            sections = cv_data['customized_sections']
+            for heading, key in ATS_SECTIONS:
+                story.append(Paragraph(heading, styles['Heading2']))
+                story.append(Spacer(1, 12))
+                for line in sections.get(key, '').split('\n'):
+                    if line.strip():
+                        story.append(Paragraph(line.strip(), styles['Normal']))
+                        story.append(Spacer(1, 6))
             
             doc.build(story)
             return filename
             
-        except ImportError:
-            return "PDF export failed - reportlab not installed"
         except Exception as e:
             return f"PDF export failed: {str(e)}"
     
     def _export_to_docx(self, cv_data: Dict, filename_prefix: str) -> str:
         """Export CV to DOCX format."""
+        if not DOCX_AVAILABLE:
+            return "DOCX export failed - python-docx not installed"
+        
         try:
-            from docx import Document
-            from docx.enum.text import WD_ALIGN_PARAGRAPH
-            
             filename = f"{filename_prefix}.docx"
             
             doc = Document()
@@ -587,24 +713,17 @@ class EnhancedCVSystem:
             title = doc.add_heading(f"{cv_data['stack_info']['name']} CV", 0)
             title.alignment = WD_ALIGN_PARAGRAPH.CENTER
             
-            # Add ATS version content
-            ats_content = cv_data['versions']['ats_optimized']
-            lines = ats_content.split('\n')
-            
-            for line in lines:
-                if line.startswith('='):
-                    # Section header
-                    section_name = line.replace('=', '').strip()
-                    if section_name:
-                        doc.add_heading(section_name, level=1)
-                elif line.strip():
-                    doc.add_paragraph(line.strip())
+            # Add ATS sections straight from the customized sections
+            sections = cv_data['customized_sections']
+            for heading, key in ATS_SECTIONS:
+                doc.add_heading(heading, level=1)
+                for line in sections.get(key, '').split('\n'):
+                    if line.strip():
+                        doc.add_paragraph(line.strip())
             
             doc.save(filename)
             return filename
             
-        except ImportError:
-            return "DOCX export failed - python-docx not installed"
         except Exception as e:
             return f"DOCX export failed: {str(e)}"
 
@@ -629,53 +748,44 @@ def main():
     # Available tech stacks
     print(f"\n🎯 Available Tech Stacks:")
     for stack, info in cv_system.tech_stacks.items():
-        print(f"  • {stack}: {info['name']}")
+        print(f"  • {stack}: {info.name}")
     
-    # Generate CV for different stacks
+    # Generate CV for different stacks; the base CV is parsed only once
     target_stacks = ['frontend', 'backend', 'fullstack', 'devops']
+    cv_sections = cv_system._parse_cv_sections(base_cv)
     
-    for stack in target_stacks:
-        print(f"\n{'='*50}")
-        print(f"Generating CV for {stack.upper()} stack...")
-        
-        try:
-            # Generate stack-specific CV
-            cv_result = cv_system.generate_stack_specific_cv(
-                base_cv, stack, 
-                job_title=f"{cv_system.tech_stacks[stack]['name']}",
-                company="Tech Company"
-            )
-            
-            print(f"✅ Generated CV for {stack}")
-            print(f"📊 Versions: {len(cv_result['versions'])}")
-            print(f"💡 Suggestions: {len(cv_result['suggestions'])}")
-            
-            # Export to different formats
-            print(f"\n📁 Exporting CV...")
-            
-            # Text export
-            text_file = cv_system.export_cv(cv_result, 'text', f"cv_{stack}")
-            print(f"  ✅ Text: {text_file}")
-            
-            # JSON export
-            json_file = cv_system.export_cv(cv_result, 'json', f"cv_{stack}")
-            print(f"  ✅ JSON: {json_file}")
+    with ThreadPoolExecutor(max_workers=len(EXPORT_FORMATS)) as executor:
+        for stack in target_stacks:
+            print(f"\n{'='*50}")
+            print(f"Generating CV for {stack.upper()} stack...")
             
-            # Markdown export
-            md_file = cv_system.export_cv(cv_result, 'markdown', f"cv_{stack}")
-            print(f"  ✅ Markdown: {md_file}")
-            
-            # PDF export
-            pdf_file = cv_system.export_cv(cv_result, 'pdf', f"cv_{stack}")
-            print(f"  ✅ PDF: {pdf_file}")
-            
-            # DOCX export
-            docx_file = cv_system.export_cv(cv_result, 'docx', f"cv_{stack}")
-            print(f"  ✅ DOCX: {docx_file}")
-            
-        except Exception as e:
-            print(f"❌ Failed to generate CV for {stack}: {e}")
-    
+            try:
+                # Generate stack-specific CV
+                cv_result = cv_system.generate_from_sections(
+                    cv_sections, stack, 
+                    job_title=f"{cv_system.tech_stacks[stack].name}",
+                    company="Tech Company",
+                    base_cv=base_cv
+                )
+                
+                print(f"✅ Generated CV for {stack}")
+                print(f"📊 Versions: {len(cv_result['versions'])}")
+                print(f"💡 Suggestions: {len(cv_result['suggestions'])}")
+                
+                # Export to different formats
+                print(f"\n📁 Exporting CV...")
+                
+                # The five exports are independent file writes, so run them concurrently
+                futures = [
+                    (label, executor.submit(cv_system.export_cv, cv_result, format_type, f"cv_{stack}"))
+                    for format_type, label in EXPORT_FORMATS
+                ]
+                for label, future in futures:
+                    print(f"  ✅ {label}: {future.result()}")
+                
+            except Exception as e:
+                print(f"❌ Failed to generate CV for {stack}: {e}")
+        
     print(f"\n🎉 CV generation completed!")
     print(f"\n📋 Generated files:")
     for file in os.listdir('.'):
@@ -2,70 +2,215 @@
 """
 Enhanced CV File Organizer with Nested ALL Folder
 Creates timestamped subfolders inside ALL folder for each generation
+
+By default each ALL copy is a hardlink to its main copy, so the bytes are
+stored once but the two names share one file: an in-place edit, chmod or
+touch of either shows up in both. Pass --copy-archive (or
+link_archive=False) to write independent copies instead.
 """
 
 import os
 import shutil
+import tempfile
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 
-def create_enhanced_organization():
-    """Create enhanced CV organization with nested ALL folder."""
+# Organized subfolders, and the subfolder each CV file extension goes to
+STANDARD_FOLDERS = ('PDF', 'DOCX', 'JSON', 'MARKDOWN', 'TEXT')
+EXTENSION_FOLDERS = {
+    '.pdf': 'PDF',
+    '.docx': 'DOCX',
+    '.json': 'JSON',
+    '.md': 'MARKDOWN',
+    '.txt': 'TEXT'
+}
+
+# Upper bound on concurrent file copies
+COPY_WORKERS = 16
+
+# Linux kernel-side copies (reflinks on btrfs/XFS); shutil.copyfile already
+# falls back to sendfile, so this only adds the faster path where it exists
+COPY_FILE_RANGE_AVAILABLE = hasattr(os, 'copy_file_range')
+COPY_CHUNK = 1 << 20
+
+def _fast_copy(source_path, dest_path):
+    """Copy file data in the kernel where possible, then metadata, like shutil.copy2."""
+    copied = False
+    if COPY_FILE_RANGE_AVAILABLE:
+        try:
+            src_fd = os.open(source_path, os.O_RDONLY)
+            try:
+                dst_fd = os.open(dest_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o666)
+                try:
+                    size = os.fstat(src_fd).st_size
+                    count = max(size, COPY_CHUNK)
+                    total = 0
+                    while True:
+                        sent = os.copy_file_range(src_fd, dst_fd, count)
+                        if not sent:
+                            break
+                        total += sent
+                    # Some filesystems return 0 before the data ends (even at offset 0),
+                    # so a short copy is redone with shutil.copyfile below
+                    copied = total == size
+                finally:
+                    os.close(dst_fd)
+            finally:
+                os.close(src_fd)
+        except OSError:
+            # Unsupported filesystem or kernel; a missing source fails again below
+            copied = False
+    
+    if not copied:
+        shutil.copyfile(source_path, dest_path)
+    shutil.copystat(source_path, dest_path)
+
+def _replace_copy(source_path, dest_path):
+    """Copy source_path to a temporary file beside dest_path, then swap it into place."""
+    # dest_path may be hardlinked to another copy, so it is replaced, never rewritten
+    fd, temp_path = tempfile.mkstemp(dir=os.path.dirname(dest_path), suffix='.tmp')
+    os.close(fd)
+    try:
+        _fast_copy(source_path, temp_path)
+        os.replace(temp_path, dest_path)
+    except BaseException:
+        os.unlink(temp_path)
+        raise
+
+def _link_or_copy(link_target, source_path, dest_path):
+    """Hardlink dest_path to link_target, replacing any existing file; copy if linking fails."""
+    try:
+        os.link(link_target, dest_path)
+        return
+    except FileExistsError:
+        # Drop the old name rather than writing through an inode it may share
+        os.unlink(dest_path)
+        try:
+            os.link(link_target, dest_path)
+            return
+        except OSError:
+            pass
+    except OSError:
+        # Cross-device, or no hardlink support on this filesystem
+        pass
+    _replace_copy(source_path, dest_path)
+
+def _make_dir(path):
+    """Create path and any missing parents; return False if it already existed."""
+    # One mkdir attempt instead of an exists() stat followed by mkdir
+    try:
+        os.makedirs(path)
+    except FileExistsError:
+        return False
+    return True
+
+def _find_cv_files(top, skip_dir=None):
+    """Yield (directory, filename) for each cv_* file under top, in os.walk order."""
+    # DirEntry caches the file type from the directory read, so no extra stat per entry
+    skip_path = os.path.join(top, skip_dir) if skip_dir else None
+    stack = [top]
+    while stack:
+        root = stack.pop()
+        subdirs = []
+        files = []
+        try:
+            with os.scandir(root) as entries:
+                for entry in entries:
+                    if entry.is_dir():
+                        # Like os.walk, don't descend into symlinked directories
+                        if not entry.is_symlink() and entry.path != skip_path:
+                            subdirs.append(entry.path)
+                    elif entry.name.startswith('cv_') and entry.is_file():
+                        files.append(entry.name)
+        except OSError:
+            # Unreadable directory; os.walk skips these as well
+            continue
+        
+        for file in files:
+            yield root, file
+        # Reversed so subdirectories are visited in listing order
+        stack.extend(reversed(subdirs))
+
+def _organize_file(root, file, main_dirs, all_dirs, main_timestamp, link_archive):
+    """Copy one CV file into its main and ALL/date-time folders; return (dest_folder, timestamped_filename)."""
+    # Determine file type; unknown extensions are filed as text
+    file_name, file_ext = os.path.splitext(file)
+    dest_folder = EXTENSION_FOLDERS.get(file_ext.lower(), 'TEXT')
+    
+    # 1. Copy to main organized folders
+    source_path = os.path.join(root, file)
+    main_dest_path = os.path.join(main_dirs[dest_folder], file)
+    _replace_copy(source_path, main_dest_path)
+    
+    # 2. Copy to ALL/date-time/subfolders with timestamped filename
+    timestamped_filename = f"{file_name}_{main_timestamp}{file_ext}"
+    all_dest_path = os.path.join(all_dirs[dest_folder], timestamped_filename)
+    if link_archive:
+        # Hardlink to the main copy so the bytes are stored once; the two names
+        # share an inode, so metadata changes and in-place edits affect both
+        _link_or_copy(main_dest_path, source_path, all_dest_path)
+    else:
+        _replace_copy(source_path, all_dest_path)
+    
+    return dest_folder, timestamped_filename
+
+def _organize_group(jobs, main_dirs, all_dirs, main_timestamp, link_archive):
+    """Organize files that share destinations one after another; return each outcome in order."""
+    outcomes = []
+    for root, file in jobs:
+        try:
+            outcomes.append(_organize_file(root, file, main_dirs, all_dirs, main_timestamp, link_archive))
+        except Exception as e:
+            outcomes.append(e)
+    return outcomes
+
+def create_enhanced_organization(link_archive=True):
+    """Create enhanced CV organization with nested ALL folder; ALL copies are hardlinks unless link_archive is False."""
+    
+    # One clock reading for every folder name and summary timestamp in this run
+    now = datetime.now()
     
     # Create main timestamped folder
-    main_timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+    main_timestamp = now.strftime("%Y%m%d_%H%M%S")
     main_folder = f"ALL_CV_FILES_{main_timestamp}"
     
-    if not os.path.exists(main_folder):
-        os.makedirs(main_folder)
+    if _make_dir(main_folder):
         print(f"📁 Created main folder: {main_folder}")
     
-    # Create standard subfolders
-    standard_folders = ['PDF', 'DOCX', 'JSON', 'MARKDOWN', 'TEXT']
-    for folder in standard_folders:
-        folder_path = os.path.join(main_folder, folder)
-        if not os.path.exists(folder_path):
-            os.makedirs(folder_path)
+    # Create standard subfolders, joining each path once for the copies below
+    main_dirs = {folder: os.path.join(main_folder, folder) for folder in STANDARD_FOLDERS}
+    for folder_path in main_dirs.values():
+        os.makedirs(folder_path, exist_ok=True)
     
     # Create the special ALL folder
     all_folder = os.path.join(main_folder, "ALL")
-    if not os.path.exists(all_folder):
-        os.makedirs(all_folder)
+    if _make_dir(all_folder):
         print(f"📁 Created ALL folder: {all_folder}")
     
     # Create date/time subfolder inside ALL
-    current_time = datetime.now()
-    date_time_folder = current_time.strftime("%Y-%m-%d_%I%p").replace("_", "/")  # e.g., "2025-01-09/4PM"
+    date_time_folder = now.strftime("%Y-%m-%d/%I%p")  # e.g., "2025-01-09/04PM"
     date_time_path = os.path.join(all_folder, date_time_folder)
     
-    if not os.path.exists(date_time_path):
-        os.makedirs(date_time_path)
+    if _make_dir(date_time_path):
         print(f"📁 Created date/time folder: {date_time_folder}")
     
     # Create subfolders inside date/time folder
-    for folder in standard_folders:
-        subfolder_path = os.path.join(date_time_path, folder)
-        if not os.path.exists(subfolder_path):
-            os.makedirs(subfolder_path)
+    all_dirs = {folder: os.path.join(date_time_path, folder) for folder in STANDARD_FOLDERS}
+    for subfolder_path in all_dirs.values():
+        os.makedirs(subfolder_path, exist_ok=True)
     
     # Search for CV files
     cv_files_found = []
     
     print("🔍 Searching for CV files...")
     
-    # Search current directory
-    for file in os.listdir('.'):
-        if os.path.isfile(file) and file.startswith('cv_'):
-            cv_files_found.append(('.', file))
-            print(f"  Found: {file}")
-    
-    # Search subdirectories
-    for root, dirs, files in os.walk('.'):
+    # Search current directory and subdirectories in one scan
+    for root, file in _find_cv_files('.', skip_dir=main_folder):
+        cv_files_found.append((root, file))
         if root == '.':
-            continue
-        for file in files:
-            if file.startswith('cv_'):
-                cv_files_found.append((root, file))
-                print(f"  Found: {root}/{file}")
+            print(f"  Found: {file}")
+        else:
+            print(f"  Found: {root}/{file}")
     
     print(f"\n🎯 Total CV files found: {len(cv_files_found)}")
     
@@ -75,46 +220,38 @@ def create_enhanced_organization():
     
     moved_count = 0
     
-    for root, file in cv_files_found:
-        try:
-            # Determine file type
-            file_ext = os.path.splitext(file)[1].lower()
-            
-            if file_ext == '.pdf':
-                dest_folder = 'PDF'
-            elif file_ext == '.docx':
-                dest_folder = 'DOCX'
-            elif file_ext == '.json':
-                dest_folder = 'JSON'
-            elif file_ext == '.md':
-                dest_folder = 'MARKDOWN'
-            elif file_ext == '.txt':
-                dest_folder = 'TEXT'
-            else:
-                dest_folder = 'TEXT'
-            
-            # 1. Copy to main organized folders
-            source_path = os.path.join(root, file)
-            main_dest_path = os.path.join(main_folder, dest_folder, file)
-            shutil.copy2(source_path, main_dest_path)
-            
-            # 2. Copy to ALL/date-time/subfolders with timestamped filename
-            file_name, file_ext = os.path.splitext(file)
-            timestamped_filename = f"{file_name}_{main_timestamp}{file_ext}"
-            all_dest_path = os.path.join(date_time_path, dest_folder, timestamped_filename)
-            shutil.copy2(source_path, all_dest_path)
-            
-            print(f"  ✅ Organized: {file}")
-            print(f"     → Main: {dest_folder}/{file}")
-            print(f"     → ALL: {dest_folder}/{timestamped_filename}")
-            
-            moved_count += 1
-            
-        except Exception as e:
-            print(f"  ❌ Failed to organize {file}: {e}")
+    # Files with the same name share both destinations, so each group of them is
+    # copied in discovery order by one task and the last one found wins, as in a
+    # sequential copy. Groups are independent and I/O-bound, so they overlap
+    groups = {}
+    for index, (root, file) in enumerate(cv_files_found):
+        groups.setdefault(file.lower(), []).append(index)
+    
+    outcomes = [None] * len(cv_files_found)
+    with ThreadPoolExecutor(max_workers=max(1, min(COPY_WORKERS, len(groups)))) as executor:
+        futures = [
+            (indices, executor.submit(_organize_group, [cv_files_found[index] for index in indices],
+                                      main_dirs, all_dirs, main_timestamp, link_archive))
+            for indices in groups.values()
+        ]
+        for indices, future in futures:
+            for index, outcome in zip(indices, future.result()):
+                outcomes[index] = outcome
+    
+    for (root, file), outcome in zip(cv_files_found, outcomes):
+        if isinstance(outcome, Exception):
+            print(f"  ❌ Failed to organize {file}: {outcome}")
+            continue
+        
+        dest_folder, timestamped_filename = outcome
+        print(f"  ✅ Organized: {file}")
+        print(f"     → Main: {dest_folder}/{file}")
+        print(f"     → ALL: {dest_folder}/{timestamped_filename}")
+        
+        moved_count += 1
     
     # Create summary files
-    create_summary_files(main_folder, all_folder, date_time_folder, moved_count, cv_files_found)
+    create_summary_files(main_folder, all_folder, date_time_folder, moved_count, cv_files_found, now)
     
     print(f"\n🎉 Enhanced organization completed!")
     print(f"📁 Main folder: {main_folder}")
@@ -125,15 +262,17 @@ def create_enhanced_organization():
     print(f"\n📁 Final folder structure:")
     show_folder_structure(main_folder)
 
-def create_summary_files(main_folder, all_folder, date_time_folder, moved_count, cv_files_found):
-    """Create summary files in both locations."""
+def create_summary_files(main_folder, all_folder, date_time_folder, moved_count, cv_files_found, now=None):
+    """Create summary files in both locations, stamped with now (default: current time)."""
+    if now is None:
+        now = datetime.now()
     
     # Main summary
     main_summary = os.path.join(main_folder, "MAIN_SUMMARY.txt")
     main_content = f"""CV Files Organization - Main Summary
 {'='*50}
 
-Organized at: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}
+Organized at: {now.strftime('%Y-%m-%d %H:%M:%S')}
 Main folder: {main_folder}
 Files organized: {moved_count}
 
@@ -164,7 +303,7 @@ All CV files are organized in both standard and timestamped formats.
     all_content = f"""CV Generation Summary - {date_time_folder}
 {'='*50}
 
-Generated at: {datetime.now().strftime('%Y-%m-%d %I:%M %p')}
+Generated at: {now.strftime('%Y-%m-%d %I:%M %p')}
 Date/Time folder: {date_time_folder}
 Files organized: {moved_count}
 
@@ -192,30 +331,54 @@ This allows you to track different versions of your CVs over time.
     print(f"📋 Main summary: {main_summary}")
     print(f"📋 ALL summary: {all_summary}")
 
-def show_folder_structure(folder_path, level=0):
+def show_folder_structure(folder_path, level=0, name=None):
     """Show the folder structure with proper indentation."""
-    indent = "  " * level
+    if not os.path.isdir(folder_path):
+        return
     
-    if os.path.isdir(folder_path):
-        print(f"{indent}{os.path.basename(folder_path)}/")
+    # Walk with an explicit stack instead of recursion. A str item is a folder's
+    # file listing, pushed under its subfolders so it prints after them
+    stack = [(folder_path, level, name)]
+    while stack:
+        item = stack.pop()
+        if isinstance(item, str):
+            print(item)
+            continue
+        
+        folder_path, level, name = item
+        indent = "  " * level
+        print(f"{indent}{name or os.path.basename(folder_path)}/")
         
         try:
-            items = os.listdir(folder_path)
-            # Sort: folders first, then files
-            folders = [item for item in items if os.path.isdir(os.path.join(folder_path, item))]
-            files = [item for item in items if os.path.isfile(os.path.join(folder_path, item))]
-            
-            # Show folders first
-            for folder in sorted(folders):
-                show_folder_structure(os.path.join(folder_path, folder), level + 1)
-            
-            # Show files
-            for file in sorted(files):
-                print(f"{indent}  {file}")
-                
+            # DirEntry carries the file type from the directory read, so no stat per entry
+            folders = []
+            files = []
+            with os.scandir(folder_path) as entries:
+                for entry in entries:
+                    if entry.is_dir():
+                        folders.append(entry)
+                    elif entry.is_file():
+                        files.append(entry)
         except PermissionError:
             print(f"{indent}  [Access Denied]")
+            continue
+        
+        # Show files after the folders
+        if files:
+            stack.append("\n".join(f"{indent}  {file.name}" for file in sorted(files, key=lambda e: e.name)))
+        
+        # Show folders first; reversed so they pop in sorted order
+        for folder in sorted(folders, key=lambda e: e.name, reverse=True):
+            stack.append((folder.path, level + 1, folder.name))
 
 if __name__ == "__main__":
-    create_enhanced_organization()
+    import argparse
+    
+    parser = argparse.ArgumentParser(description="Enhanced CV File Organizer")
+    parser.add_argument("--copy-archive", action="store_true",
+                        help="Write the ALL copies as independent files instead of hardlinks to the main copies")
+    
+    args = parser.parse_args()
+    
+    create_enhanced_organization(link_archive=not args.copy_archive)
 
@@ -120,13 +120,14 @@ class EntryLevelJobApplication:
         """Create entry-level appropriate summary"""
         job_title = job_info.get('title', 'Junior Developer')
         
-        summary = f"Passionate {job_title} seeking first professional opportunity to apply technical skills in a collaborative environment. "
-        summary += "Strong foundation in modern web technologies with hands-on experience building full-stack applications. "
-        summary += "Demonstrated coding abilities through personal projects with complete source code available on GitHub. "
-        summary += "Eager to learn from experienced developers, contribute to real-world projects, and grow professionally. "
-        summary += "Committed to writing clean, maintainable code and following industry best practices."
-        
-        return summary
+        # Adjacent literals are joined at compile time, so only the f-string is built at runtime
+        return (
+            f"Passionate {job_title} seeking first professional opportunity to apply technical skills in a collaborative environment. "
+            "Strong foundation in modern web technologies with hands-on experience building full-stack applications. "
+            "Demonstrated coding abilities through personal projects with complete source code available on GitHub. "
+            "Eager to learn from experienced developers, contribute to real-world projects, and grow professionally. "
+            "Committed to writing clean, maintainable code and following industry best practices."
+        )
     
     def get_entry_level_job_suggestions(self) -> List[Dict[str, Any]]:
         """Get entry-level job suggestions"""
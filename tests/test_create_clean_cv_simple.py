@@ -0,0 +1,69 @@
+"""Tests for the PDF/HTML branch of create_clean_cv_simple."""
+import os
+
+import pytest
+
+import create_clean_cv_simple
+
+
+class FakeHTML:
+    """Stand-in for weasyprint.HTML that writes a placeholder PDF."""
+
+    def __init__(self, string):
+        self.string = string
+
+    def write_pdf(self, target):
+        with open(target, 'wb') as f:
+            f.write(b'%PDF-1.4 fake')
+
+
+def _generate(monkeypatch, tmp_path):
+    monkeypatch.chdir(tmp_path)
+    output_dir = create_clean_cv_simple.create_cv_files()
+    with open(os.path.join(output_dir, "GENERATION_SUMMARY.txt"), encoding='utf-8') as f:
+        summary = f.read()
+    return set(os.listdir(output_dir)), summary
+
+
+def test_weasyprint_writes_pdf_only(monkeypatch, tmp_path, capsys):
+    monkeypatch.setattr(create_clean_cv_simple, 'WEASYPRINT_AVAILABLE', True)
+    monkeypatch.setattr(create_clean_cv_simple, 'HTML', FakeHTML, raising=False)
+
+    files, summary = _generate(monkeypatch, tmp_path)
+
+    assert "Abdallah_Nasr_Ali_CV.pdf" in files
+    assert "Abdallah_Nasr_Ali_CV.html" not in files
+    assert "Abdallah_Nasr_Ali_CV.pdf - PDF format" in summary
+    assert ".html" not in summary
+    banner = capsys.readouterr().out
+    assert "PDF CV: Abdallah_Nasr_Ali_CV.pdf" in banner
+    assert "Abdallah_Nasr_Ali_CV.html" not in banner
+
+
+def test_without_weasyprint_writes_html(monkeypatch, tmp_path, capsys):
+    monkeypatch.setattr(create_clean_cv_simple, 'WEASYPRINT_AVAILABLE', False)
+
+    files, summary = _generate(monkeypatch, tmp_path)
+
+    assert "Abdallah_Nasr_Ali_CV.html" in files
+    assert "Abdallah_Nasr_Ali_CV.pdf" not in files
+    assert "Open Abdallah_Nasr_Ali_CV.html in your web browser" in summary
+    assert "HTML CV: Abdallah_Nasr_Ali_CV.html" in capsys.readouterr().out
+
+
+@pytest.mark.parametrize('weasyprint_available', [True, False])
+def test_failed_document_is_not_reported_as_created(monkeypatch, tmp_path, capsys, weasyprint_available):
+    def fail(fields):
+        raise RuntimeError("render failed")
+
+    monkeypatch.setattr(create_clean_cv_simple, 'WEASYPRINT_AVAILABLE', weasyprint_available)
+    monkeypatch.setattr(create_clean_cv_simple, 'HTML', FakeHTML, raising=False)
+    monkeypatch.setattr(create_clean_cv_simple, '_render_html_cv', fail)
+
+    files, summary = _generate(monkeypatch, tmp_path)
+
+    assert not files & {"Abdallah_Nasr_Ali_CV.pdf", "Abdallah_Nasr_Ali_CV.html"}
+    assert "NOT CREATED" in summary
+    out = capsys.readouterr().out
+    assert "CLEAN CV GENERATION INCOMPLETE" in out
+    assert "CLEAN CV GENERATION COMPLETE!" not in out
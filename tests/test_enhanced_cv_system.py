@@ -0,0 +1,36 @@
+"""Tests for stack keyword highlighting in enhanced_cv_system."""
+import pytest
+
+pytest.importorskip('openai')
+pytest.importorskip('dotenv')
+
+from enhanced_cv_system import EnhancedCVSystem
+
+
+@pytest.fixture(scope='module')
+def cv_system():
+    return EnhancedCVSystem()
+
+
+def test_short_keywords_only_match_their_exact_casing(cv_system):
+    backend = cv_system.tech_stacks['backend']
+
+    highlighted = cv_system._highlight_keywords("My go-to language is Go.\nAlso r and R.", backend)
+
+    assert highlighted == "My go-to language is **Go**.\nAlso r and R."
+
+
+def test_long_keywords_match_in_any_case(cv_system):
+    frontend = cv_system.tech_stacks['frontend']
+
+    highlighted = cv_system._highlight_keywords("Built UIs in javascript and React", frontend)
+
+    assert highlighted == "Built UIs in **javascript** and **React**"
+
+
+def test_short_data_science_keyword_r(cv_system):
+    data_science = cv_system.tech_stacks['data_science']
+
+    highlighted = cv_system._highlight_keywords("Modelled in R, not r", data_science)
+
+    assert highlighted == "Modelled in **R**, not r"